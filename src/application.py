@@ -136,9 +136,14 @@ class Application:
         logger = logging.getLogger(__name__)
         logger.info(f"{APP_NAME} application initializing")
 
-        # Initialize audio player before UI (so instruments are available for menu)
-        logger.info("Initializing audio system")
-        self._audio_service.initialize_player()
+        # Load the audio player in the background while the UI is built, unless
+        # the user asked for it to be ready before the window appears
+        if self._config_service.get("preload_audio", False):
+            logger.info("Initializing audio system")
+            self._audio_service.initialize_player()
+        else:
+            logger.info("Initializing audio system in the background")
+            self._audio_service.initialize_player_async()
 
         # Initialize UI
         self.on_initialize_ui()
@@ -240,6 +245,10 @@ class Application:
 
         logger.info("Application shutdown complete")
 
+        # Flush queued log records last so the messages above reach the file
+        if self._logging_service is not None:
+            self._logging_service.shutdown()
+
     # Event queue methods (moved from MainWindow)
 
     def queue_ui_callback(self, callback: Callable) -> None:
@@ -4,14 +4,13 @@ Chord note picker - converts chords to MIDI notes with voice leading
 
 from typing import Dict, List, Optional, TYPE_CHECKING
 from dataclasses import dataclass, asdict
-from copy import deepcopy
 from audio.note_picker_interface import INotePicker
 
 if TYPE_CHECKING:
     from models.chord_notes import ChordNotes
 
 
-@dataclass
+@dataclass(slots=True)
 class ChordPickerState:
     """Immutable state object for chord picker"""
     previous_chord_midi: Optional[List[int]] = None
@@ -28,6 +27,15 @@ class ChordPickerState:
         """Create from dict"""
         return cls(**data)
 
+    def clone(self) -> 'ChordPickerState':
+        """Create an independent copy without a dict or deepcopy round trip"""
+        return ChordPickerState(
+            previous_chord_midi=list(self.previous_chord_midi) if self.previous_chord_midi is not None else None,
+            previous_chord_notes=list(self.previous_chord_notes) if self.previous_chord_notes is not None else None,
+            voicing_octave=self.voicing_octave,
+            position_context=self.position_context
+        )
+
 
 class ChordNotePicker(INotePicker):
     """Picks MIDI notes for chords with intelligent voice leading"""
@@ -60,12 +68,12 @@ class ChordNotePicker(INotePicker):
     @property
     def state(self) -> ChordPickerState:
         """Get current state (returns a copy to prevent external modification)"""
-        return deepcopy(self._state)
+        return self._state.clone()
 
     @state.setter
     def state(self, new_state: ChordPickerState) -> None:
         """Set state (accepts a copy to prevent external references)"""
-        self._state = deepcopy(new_state)
+        self._state = new_state.clone()
 
     def reset(self) -> None:
         """Reset to initial state"""
@@ -1,7 +1,7 @@
 """Thread-safe event buffer for producer-consumer playback architecture."""
 import threading
 from collections import deque
-from typing import Optional
+from typing import Optional, Sequence
 
 from models.playback_event_internal import MidiEvent
 
@@ -29,6 +29,10 @@ class EventBuffer:
         self._not_full = threading.Condition(self._lock)
         self._not_empty = threading.Condition(self._lock)
         self._closed = False
+        # Number of threads blocked in push/pop; notify() is skipped when zero,
+        # since Condition.notify() on a plain Lock costs an extra acquire attempt
+        self._producers_waiting = 0
+        self._consumers_waiting = 0
 
     def push_event(self, event: MidiEvent, timeout: Optional[float] = None) -> bool:
         """Push an event to the buffer (blocks if full).
@@ -46,14 +50,56 @@ class EventBuffer:
         with self._not_full:
             # Wait until buffer has space or timeout
             while len(self._buffer) >= self._capacity and not self._closed:
-                if not self._not_full.wait(timeout=timeout):
-                    return False  # Timeout occurred
+                self._producers_waiting += 1
+                try:
+                    if not self._not_full.wait(timeout=timeout):
+                        return False  # Timeout occurred
+                finally:
+                    self._producers_waiting -= 1
 
             if self._closed:
                 raise ValueError("Cannot push to closed buffer")
 
             self._buffer.append(event)
-            self._not_empty.notify()  # Wake up consumer
+            if self._consumers_waiting:
+                self._not_empty.notify()  # Wake up consumer
+            return True
+
+    def push_events(self, events: Sequence[MidiEvent], timeout: Optional[float] = None) -> bool:
+        """Push several events to the buffer at once (blocks until all fit).
+
+        The events are added together under a single lock acquisition, so a
+        consumer never sees part of the batch without the rest.
+
+        Args:
+            events: The MIDI events to add, in order
+            timeout: Maximum time to wait if buffer is full (None = wait forever)
+
+        Returns:
+            True if the events were added, False if timeout occurred
+
+        Raises:
+            ValueError: If buffer is closed
+        """
+        # A batch larger than the buffer is pushed once the buffer is empty
+        max_size = self._capacity - min(len(events), self._capacity)
+
+        with self._not_full:
+            # Wait until buffer has space for the whole batch or timeout
+            while len(self._buffer) > max_size and not self._closed:
+                self._producers_waiting += 1
+                try:
+                    if not self._not_full.wait(timeout=timeout):
+                        return False  # Timeout occurred
+                finally:
+                    self._producers_waiting -= 1
+
+            if self._closed:
+                raise ValueError("Cannot push to closed buffer")
+
+            self._buffer.extend(events)
+            if self._consumers_waiting:
+                self._not_empty.notify()  # Wake up consumer
             return True
 
     def pop_event(self, timeout: Optional[float] = None) -> Optional[MidiEvent]:
@@ -68,14 +114,19 @@ class EventBuffer:
         with self._not_empty:
             # Wait until buffer has events or timeout
             while len(self._buffer) == 0 and not self._closed:
-                if not self._not_empty.wait(timeout=timeout):
-                    return None  # Timeout occurred
+                self._consumers_waiting += 1
+                try:
+                    if not self._not_empty.wait(timeout=timeout):
+                        return None  # Timeout occurred
+                finally:
+                    self._consumers_waiting -= 1
 
             if len(self._buffer) == 0:
                 return None  # Buffer closed and empty
 
             event = self._buffer.popleft()
-            self._not_full.notify()  # Wake up producer
+            if self._producers_waiting:
+                self._not_full.notify()  # Wake up producer
             return event
 
     def peek_next(self) -> Optional[MidiEvent]:
@@ -4,7 +4,6 @@ Guitar chord picker - optimized version with correct note generation
 
 from typing import Dict, List, Optional, Tuple, Set, Union, TYPE_CHECKING
 from dataclasses import dataclass, asdict
-from copy import deepcopy
 import logging
 from audio.note_picker_interface import INotePicker
 
@@ -14,7 +13,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class GuitarPickerState:
     """Immutable state object for guitar chord picker"""
     previous_fingering: Optional[List[int]] = None
@@ -31,6 +30,15 @@ class GuitarPickerState:
         """Create from dict"""
         return cls(**data)
 
+    def clone(self) -> 'GuitarPickerState':
+        """Create an independent copy without a dict or deepcopy round trip"""
+        return GuitarPickerState(
+            previous_fingering=list(self.previous_fingering) if self.previous_fingering is not None else None,
+            previous_chord_notes=list(self.previous_chord_notes) if self.previous_chord_notes is not None else None,
+            current_position=self.current_position,
+            position_context=self.position_context
+        )
+
 
 class GuitarChordPicker(INotePicker):
     """Optimized guitar chord picker with correct voicing generation"""
@@ -144,12 +152,12 @@ class GuitarChordPicker(INotePicker):
     @property
     def state(self) -> GuitarPickerState:
         """Get current state (returns a copy)"""
-        return deepcopy(self._state)
+        return self._state.clone()
 
     @state.setter  
     def state(self, new_state: GuitarPickerState) -> None:
         """Set state (accepts a copy)"""
-        self._state = deepcopy(new_state)
+        self._state = new_state.clone()
 
     def reset(self) -> None:
         """Reset to initial state"""
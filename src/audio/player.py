@@ -9,9 +9,13 @@ from pathlib import Path
 from typing import Optional, List, Tuple, Callable, Dict
 import fluidsynth
 from audio.player_interface import IPlayer
+from models.playback_event import PlaybackEventArgs, PlaybackEventType
 
 logger = logging.getLogger(__name__)
 
+# Channels used to keep preloaded programs resident (channel 9 is GM percussion)
+_PRELOAD_CHANNELS = tuple(ch for ch in range(1, 16) if ch != 9)
+
 
 class NotePlayer(IPlayer):
     """Audio player for MIDI notes using FluidSynth"""
@@ -29,6 +33,7 @@ class NotePlayer(IPlayer):
         self.sfid = None
         self.channel = 0
         self.instrument = 0  # Acoustic Grand Piano by default
+        self._preload_channels: Dict[int, int] = {}  # program -> channel holding it
 
         # Timing information
         self.bpm = bpm
@@ -100,6 +105,12 @@ class NotePlayer(IPlayer):
             self.fs.setting('synth.gain', 0.5)
             logger.debug("Gain set")
 
+            # Only load a preset's samples once it is selected on a channel,
+            # instead of reading the whole soundfont up front. Samples are
+            # unloaded when no channel uses the preset, so programs are kept
+            # resident with load_program()
+            self.fs.setting('synth.dynamic-sample-loading', 1)
+
             # Start audio output
             # Try different drivers in order of preference
             drivers = ['alsa', 'pulseaudio', 'oss']
@@ -176,6 +187,37 @@ class NotePlayer(IPlayer):
             self.instrument = program
             self.fs.program_select(self.channel, self.sfid, 0, program)
 
+    def load_program(self, program: int) -> bool:
+        """
+        Load the samples for a program without changing the current instrument
+
+        The program is bound to a spare channel so that its samples stay
+        resident and later switching to it is instant.
+
+        Args:
+            program: MIDI program number (0-127)
+
+        Returns:
+            True if the program is loaded, False otherwise
+        """
+        if not self.fs or self.sfid is None:
+            return False
+
+        if program in self._preload_channels:
+            return True
+
+        if len(self._preload_channels) >= len(_PRELOAD_CHANNELS):
+            logger.debug(f"No free channel to preload program {program}")
+            return False
+
+        channel = _PRELOAD_CHANNELS[len(self._preload_channels)]
+        if self.fs.program_select(channel, self.sfid, 0, program) != 0:
+            logger.warning(f"Failed to preload program {program}")
+            return False
+
+        self._preload_channels[program] = channel
+        return True
+
     def play_notes_immediate(self, midi_notes: List[int], duration: float = 2.0) -> None:
         """
         Play notes immediately (for manual clicks) and schedule NOTE_OFF after duration
@@ -293,10 +335,10 @@ class NotePlayer(IPlayer):
             logger.debug("Starting playback thread")
             self.is_playing = True
             self.is_paused = False
+            self.stop_event = threading.Event()
+            self.pause_event = threading.Event()
+            self.pause_event.set()  # Not paused initially
 
-        self.stop_event = threading.Event()
-        self.pause_event = threading.Event()
-        self.pause_event.set()  # Not paused initially
         self._playback_start_time = None  # Will be set on first event
 
         self.playback_thread = threading.Thread(target=self._playback_loop, daemon=True)
@@ -334,9 +376,10 @@ class NotePlayer(IPlayer):
             logger.debug("Stopping playback")
             self.is_playing = False
             self.is_paused = False
+            # Set together with is_playing so the playback loop only needs to check the event
+            if self.stop_event:
+                self.stop_event.set()
 
-        if self.stop_event:
-            self.stop_event.set()
         if self.pause_event:
             self.pause_event.set()  # Unblock if paused
 
@@ -347,6 +390,32 @@ class NotePlayer(IPlayer):
         self.stop_all_notes()
         logger.debug("Playback stopped")
 
+    def _queue_chord_start_callback(self, metadata: dict) -> None:
+        """Queue a CHORD_START event callback on the UI thread.
+
+        Each event gets its own PlaybackEventArgs, since the UI thread may
+        handle it after the next event has been played.
+
+        Args:
+            metadata: Event metadata carrying the chord and playback state
+        """
+        try:
+            event_args = PlaybackEventArgs(
+                event_type=PlaybackEventType.CHORD_START,
+                chord_info=metadata.get('chord_info'),
+                bpm=metadata.get('bpm'),
+                time_signature_beats=metadata.get('time_signature_beats'),
+                time_signature_unit=metadata.get('time_signature_unit'),
+                key=metadata.get('key'),
+                current_line=metadata.get('line_index'),
+                current_bar=metadata.get('bar'),
+                total_bars=metadata.get('total_bars')
+            )
+            callback = self.on_event_callback
+            self.application.queue_ui_callback(lambda: callback(event_args))
+        except Exception as e:
+            logger.error("Error in playback event callback: %s", e, exc_info=True)
+
     def _playback_loop(self) -> None:
         """Main playback loop running in separate thread - consumes events from buffer."""
         import time
@@ -356,32 +425,35 @@ class NotePlayer(IPlayer):
 
         natural_end = False  # Track if playback ended naturally
 
+        # stop_playback() sets stop_event under the state lock when it clears
+        # is_playing, so checking the event alone needs no lock
+        stop_event = self.stop_event
+        pause_event = self.pause_event
+
         while True:
-            with self._state_lock:
-                if not self.is_playing or self.stop_event.is_set():
-                    break
+            if stop_event.is_set():
+                break
 
             # Check if paused
-            if not self.pause_event.wait(timeout=0.1):
+            if not pause_event.wait(timeout=0.1):
                 continue  # Still paused
 
-            with self._state_lock:
-                if not self.is_playing:
-                    break
+            if stop_event.is_set():
+                break
 
             # Get next event from buffer (with timeout)
             logger.debug("Fetching next event from buffer")
             try:
                 event = self.event_buffer.pop_event(timeout=0.1)
             except Exception as e:
-                logger.error(f"Exception getting event from buffer: {e}", exc_info=True)
+                logger.error("Exception getting event from buffer: %s", e, exc_info=True)
                 break
 
             if event is None:
                 # Timeout - check if we should continue waiting
                 continue
 
-            logger.debug(f"Got event: {event}")
+            logger.debug("Got event: %s", event)
 
             # Handle END_OF_SONG event
             if event.event_type == MidiEventType.END_OF_SONG:
@@ -394,7 +466,7 @@ class NotePlayer(IPlayer):
             # Initialize playback start time on first event
             if self._playback_start_time is None:
                 self._playback_start_time = time.time()
-                logger.debug(f"Playback start time initialized: {self._playback_start_time}")
+                logger.debug("Playback start time initialized: %s", self._playback_start_time)
 
             # Calculate when this event should be played
             target_time = self._playback_start_time + event.timestamp
@@ -403,23 +475,21 @@ class NotePlayer(IPlayer):
 
             # Sleep until target time (if in the future)
             if wait_time > 0:
-                logger.debug(f"Waiting {wait_time:.3f}s until event at t={event.timestamp:.3f}s")
+                logger.debug("Waiting %.3fs until event at t=%.3fs", wait_time, event.timestamp)
                 # Sleep in small chunks to be responsive to stop/pause
                 sleep_chunks = max(1, int(wait_time / 0.1))
                 chunk_duration = wait_time / sleep_chunks
                 for _ in range(sleep_chunks):
-                    with self._state_lock:
-                        should_stop = not self.is_playing or self.stop_event.is_set()
-                    if should_stop:
+                    if stop_event.is_set():
                         break
                     # Check pause status
-                    if not self.pause_event.is_set():
+                    if not pause_event.is_set():
                         # Paused - adjust playback start time to account for pause duration
                         pause_start = time.time()
-                        self.pause_event.wait()  # Wait until unpaused
+                        pause_event.wait()  # Wait until unpaused
                         pause_duration = time.time() - pause_start
                         self._playback_start_time += pause_duration
-                        logger.debug(f"Paused for {pause_duration:.3f}s, adjusted start time")
+                        logger.debug("Paused for %.3fs, adjusted start time", pause_duration)
                         break
                     time.sleep(min(chunk_duration, wait_time))
                     wait_time -= chunk_duration
@@ -427,12 +497,11 @@ class NotePlayer(IPlayer):
                         break
             elif wait_time < -0.1:
                 # Event is significantly late - log warning
-                logger.warning(f"Event is {-wait_time:.3f}s late (target={event.timestamp:.3f}s)")
+                logger.warning("Event is %.3fs late (target=%.3fs)", -wait_time, event.timestamp)
 
             # Check if we should stop before playing
-            with self._state_lock:
-                if not self.is_playing or self.stop_event.is_set():
-                    break
+            if stop_event.is_set():
+                break
 
             # Handle NOTE_ON event
             if event.event_type == MidiEventType.NOTE_ON:
@@ -440,73 +509,44 @@ class NotePlayer(IPlayer):
                     # Play notes (don't stop existing notes - allows overlapping/arpeggio)
                     for midi_note in event.midi_notes:
                         self.fs.noteon(self.channel, midi_note, event.velocity)
-                    logger.debug(f"Played notes: {event.midi_notes}")
+                    logger.debug("Played notes: %s", event.midi_notes)
 
                 # Fire event callback if provided and metadata indicates it should be called
                 if self.on_event_callback and self.application and event.metadata.get('has_callback'):
-                    try:
-                        from models.playback_event import PlaybackEventArgs, PlaybackEventType
-                        event_args = PlaybackEventArgs(
-                            event_type=PlaybackEventType.CHORD_START,
-                            chord_info=event.metadata.get('chord_info'),
-                            bpm=event.metadata.get('bpm'),
-                            time_signature_beats=event.metadata.get('time_signature_beats'),
-                            time_signature_unit=event.metadata.get('time_signature_unit'),
-                            key=event.metadata.get('key'),
-                            current_line=event.metadata.get('line_index'),
-                            current_bar=event.metadata.get('bar'),
-                            total_bars=event.metadata.get('total_bars')
-                        )
-                        # Queue callback to UI thread
-                        self.application.queue_ui_callback(lambda: self.on_event_callback(event_args))
-                    except Exception as e:
-                        logger.error(f"Error in playback event callback: {e}", exc_info=True)
+                    self._queue_chord_start_callback(event.metadata)
 
             # Handle NOTE_OFF event
             elif event.event_type == MidiEventType.NOTE_OFF:
                 if self.fs and event.midi_notes:
                     for midi_note in event.midi_notes:
                         self.fs.noteoff(self.channel, midi_note)
-                    logger.debug(f"Released notes: {event.midi_notes}")
+                    logger.debug("Released notes: %s", event.midi_notes)
 
             # Handle REST event (NC - No Chord)
             elif event.event_type == MidiEventType.REST:
                 # REST plays no notes, but fires callback for UI highlighting
-                logger.debug(f"REST event at t={event.timestamp:.3f}s (duration={event.metadata.get('duration_seconds', 0):.3f}s)")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("REST event at t=%.3fs (duration=%.3fs)",
+                                 event.timestamp, event.metadata.get('duration_seconds', 0))
 
                 # Fire event callback if provided
                 if self.on_event_callback and self.application and event.metadata.get('has_callback'):
-                    try:
-                        from models.playback_event import PlaybackEventArgs, PlaybackEventType
-                        event_args = PlaybackEventArgs(
-                            event_type=PlaybackEventType.CHORD_START,
-                            chord_info=event.metadata.get('chord_info'),
-                            bpm=event.metadata.get('bpm'),
-                            time_signature_beats=event.metadata.get('time_signature_beats'),
-                            time_signature_unit=event.metadata.get('time_signature_unit'),
-                            key=event.metadata.get('key'),
-                            current_line=event.metadata.get('line_index'),
-                            current_bar=event.metadata.get('bar'),
-                            total_bars=event.metadata.get('total_bars')
-                        )
-                        # Queue callback to UI thread
-                        self.application.queue_ui_callback(lambda: self.on_event_callback(event_args))
-                    except Exception as e:
-                        logger.error(f"Error in REST event callback: {e}", exc_info=True)
+                    self._queue_chord_start_callback(event.metadata)
 
         # Stop all notes when exiting
         self.stop_all_notes()
         logger.debug("Playback loop ended")
 
         # Call finished callback if playback ended naturally (not via stop)
-        logger.debug(f"Checking callback: natural_end={natural_end}, callback={self.on_playback_finished_callback is not None}")
+        logger.debug("Checking callback: natural_end=%s, callback=%s",
+                     natural_end, self.on_playback_finished_callback is not None)
         if natural_end and self.on_playback_finished_callback:
             logger.debug("Calling playback finished callback")
             try:
                 self.on_playback_finished_callback()
                 logger.debug("Playback finished callback completed")
             except Exception as e:
-                logger.error(f"Exception in playback finished callback: {e}", exc_info=True)
+                logger.error("Exception in playback finished callback: %s", e, exc_info=True)
         else:
             logger.debug("Skipping callback (stopped manually or no callback)")
 
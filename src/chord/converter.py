@@ -6,6 +6,11 @@ import unicodedata
 from typing import Literal
 
 
+# str.translate table deleting the combining diacritical marks block (U+0300-U+036F),
+# which holds the accents found on European note names after NFD decomposition
+_COMBINING_MARKS_TRANS = dict.fromkeys(range(0x0300, 0x0370))
+
+
 class NotationConverter:
     """Convert between American (C, D, E...) and European (Do, Re, Mi...) notation"""
 
@@ -29,6 +34,11 @@ class NotationConverter:
 
     EUROPEAN_TO_AMERICAN = {v: k for k, v in AMERICAN_TO_EUROPEAN.items()}
 
+    # European roots ordered longest first, so "Sol" is tried before shorter prefixes
+    _EUROPEAN_ROOTS_LONGEST_FIRST = tuple(
+        sorted(EUROPEAN_TO_AMERICAN.items(), key=lambda item: len(item[0]), reverse=True)
+    )
+
     @staticmethod
     def _normalize_to_ascii(text: str) -> str:
         """
@@ -46,11 +56,17 @@ class NotationConverter:
         Returns:
             ASCII string with accents removed
         """
+        # Most chord text is plain ASCII already
+        if text.isascii():
+            return text
+
         # NFD normalization separates characters from their accents
-        nfd = unicodedata.normalize('NFD', text)
-        # Filter out combining characters (accents)
-        ascii_text = ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
-        return ascii_text
+        nfd = unicodedata.normalize('NFD', text).translate(_COMBINING_MARKS_TRANS)
+        if nfd.isascii():
+            return nfd
+
+        # Filter out any remaining combining characters outside the common block
+        return ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
 
     @classmethod
     def american_to_european(cls, chord_str: str) -> str:
@@ -128,7 +144,7 @@ class NotationConverter:
 
         # Try to match European roots (Do, Re, Mi, etc.)
         # Check lowercase first (longer matches), then uppercase
-        for european, american in sorted(cls.EUROPEAN_TO_AMERICAN.items(), key=lambda x: len(x[0]), reverse=True):
+        for european, american in cls._EUROPEAN_ROOTS_LONGEST_FIRST:
             if chord_part.startswith(european):
                 # Check for sharp/flat after European root
                 suffix_start = len(european)
@@ -10,6 +10,16 @@ from chord.midi_converter import ChordToMidiConverter
 from models.chord_notes import ChordNotes
 
 
+# Translation tables for single-character cleanups (one C-level pass each)
+_PAREN_TRANS = str.maketrans('', '', '()')
+_UNICODE_SYMBOL_TRANS = str.maketrans({
+    '♭': 'b',
+    '♯': '#',
+    '♮': None,  # Natural sign - just remove it
+    'Δ': 'maj',  # Triangle for major 7th
+})
+
+
 class ChordHelper:
     """
     Unified chord helper that combines pychord, music21, and custom chord handling
@@ -76,10 +86,6 @@ class ChordHelper:
         'dimm9': [0, 3, 6, 10, 14],     # Diminished minor 9th
     }
 
-    def __init__(self) -> None:
-        """Initialize chord helper"""
-        self.midi_converter = ChordToMidiConverter()
-
     def is_valid_chord(self, chord_name: str) -> bool:
         """
         Check if a chord name is valid
@@ -139,7 +145,7 @@ class ChordHelper:
         if not notes:
             return None
 
-        return self.midi_converter.chord_to_midi(notes, base_octave)
+        return ChordToMidiConverter.chord_to_midi(notes, base_octave)
 
     def identify_chord(self, notes: List[str], actual_bass_note: Optional[str] = None) -> Set[str]:
         """
@@ -639,18 +645,7 @@ class ChordHelper:
         Returns:
             Chord with ASCII symbols
         """
-        # Unicode to ASCII mapping
-        replacements = {
-            '♭': 'b',
-            '♯': '#',
-            '♮': '',  # Natural sign - just remove it
-            'Δ': 'maj',  # Triangle for major 7th
-        }
-
-        for unicode_char, ascii_char in replacements.items():
-            chord_name = chord_name.replace(unicode_char, ascii_char)
-
-        return chord_name
+        return chord_name.translate(_UNICODE_SYMBOL_TRANS)
 
     def _normalize_enharmonics(self, chord_name: str) -> str:
         """Normalize enharmonic equivalents to standard forms.
@@ -802,6 +797,6 @@ class ChordHelper:
         chord_name = re.sub(r'\)\(no', r'omit', chord_name)
         chord_name = re.sub(r'\)\(omit', r'omit', chord_name)
         # Clean up any remaining parentheses
-        chord_name = chord_name.replace('(', '').replace(')', '')
+        chord_name = chord_name.translate(_PAREN_TRANS)
 
         return chord_name
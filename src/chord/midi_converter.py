@@ -2,28 +2,32 @@
 Convert chord names to MIDI note numbers
 """
 
+import sys
+from types import MappingProxyType
 from typing import List, Optional
 
 
+# MIDI number of C in each octave from -1 to 14, indexed by octave + 1
+_OCTAVE_BASE = tuple((octave + 1) * 12 for octave in range(-1, 15))
+
+
 class ChordToMidiConverter:
     """
     Converts chord names to MIDI note numbers
 
-    Handles both standard chords and exotic notations
+    Handles both standard chords and exotic notations. The converter is
+    stateless, so all methods are static and can be called on the class.
     """
 
-    # Note name to semitone mapping
-    NOTE_MAP = {
+    # Note name to semitone mapping (read-only, shared across threads)
+    NOTE_MAP = MappingProxyType({sys.intern(name): semitone for name, semitone in {
         'C': 0, 'C#': 1, 'Db': 1, 'D': 2, 'D#': 3, 'Eb': 3,
         'E': 4, 'E-': 4, 'F': 5, 'F#': 6, 'Gb': 6, 'G': 7,
         'G#': 8, 'Ab': 8, 'A': 9, 'A#': 10, 'Bb': 10, 'B': 11, 'B-': 11
-    }
-
-    def __init__(self) -> None:
-        """Initialize converter"""
-        pass
+    }.items()})
 
-    def chord_to_midi(self, chord_notes: List[str], base_octave: int = 4) -> Optional[List[int]]:
+    @staticmethod
+    def chord_to_midi(chord_notes: List[str], base_octave: int = 4) -> Optional[List[int]]:
         """
         Convert list of note names to MIDI note numbers
 
@@ -43,7 +47,7 @@ class ChordToMidiConverter:
 
         for note_name in chord_notes:
             # Get the pitch class (0-11)
-            note_class = self.NOTE_MAP.get(note_name)
+            note_class = ChordToMidiConverter.NOTE_MAP.get(note_name)
 
             if note_class is None:
                 return None
@@ -64,7 +68,8 @@ class ChordToMidiConverter:
 
         return midi_notes
 
-    def note_to_midi(self, note_name: str, octave: int) -> Optional[int]:
+    @staticmethod
+    def note_to_midi(note_name: str, octave: int) -> Optional[int]:
         """
         Convert a single note name and octave to MIDI number
 
@@ -75,8 +80,10 @@ class ChordToMidiConverter:
         Returns:
             int: MIDI note number or None if invalid
         """
-        note_class = self.NOTE_MAP.get(note_name)
+        note_class = ChordToMidiConverter.NOTE_MAP.get(note_name)
         if note_class is None:
             return None
 
+        if -1 <= octave < 15:
+            return note_class + _OCTAVE_BASE[octave + 1]
         return note_class + (octave + 1) * 12
@@ -50,6 +50,8 @@ MIDI_CHANNEL = 0
 # Logging
 LOG_MAX_BYTES = 1024 * 1024  # 1MB per log file
 LOG_BACKUP_COUNT = 10  # Keep 10 old log files
+LOG_BUFFER_CAPACITY = 512  # Records held in memory before writing to the log file
+LOG_FLUSH_INTERVAL = 1.0  # Seconds between periodic log buffer flushes
 DEFAULT_LOG_LEVEL = "INFO"
 
 
@@ -2,8 +2,9 @@
 Chord model for storing chord information
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
 
 @dataclass
@@ -14,6 +15,9 @@ class ChordInfo:
     including its position, validity, notes, and musical properties.
     """
 
+    kind: ClassVar[int] = 0
+    """Item type tag shared with Directive (0 = chord, 1 = directive)"""
+
     # Core properties
     chord: str
     """The chord string (e.g., "C", "Am", "Do", "rem", "I", "V7", "C/G", "vi/I")"""
@@ -36,6 +40,10 @@ class ChordInfo:
     duration: Optional[float] = None
     """Duration of the chord in beats"""
 
+    def __post_init__(self) -> None:
+        """Intern the chord string; songs repeat a small chord vocabulary."""
+        self.chord = sys.intern(self.chord)
+
     def __repr__(self) -> str:
         """String representation of the chord."""
         return f"ChordInfo(chord='{self.chord}', start={self.start}, end={self.end}, valid={self.is_valid})"
@@ -2,19 +2,32 @@
 ChordNotes model - represents resolved chord notes
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import List
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChordNotes:
     """Result of chord note computation.
 
+    Instances are immutable and hashable (the hash covers bass_note and root,
+    since the notes list itself is unhashable), so they can be cached.
+
     Attributes:
         notes: List of note names in the chord (e.g., ['C', 'E', 'G'])
         bass_note: The bass note (may differ from root for slash chords)
         root: The root note of the chord
     """
-    notes: List[str]
+    notes: List[str] = field(hash=False)
     bass_note: str
     root: str
+
+    def __post_init__(self) -> None:
+        """Intern note names, which come from a small fixed vocabulary."""
+        intern = sys.intern
+        object.__setattr__(self, 'notes', [intern(note) for note in self.notes])
+        if self.bass_note:
+            object.__setattr__(self, 'bass_note', intern(self.bass_note))
+        if self.root:
+            object.__setattr__(self, 'root', intern(self.root))
@@ -4,6 +4,10 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Literal, Dict
 
 
+_VALID_NOTATIONS = frozenset({"american", "european"})
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+
 @dataclass
 class Config:
     """Application configuration model with validation."""
@@ -41,6 +45,8 @@ class Config:
     # Audio
     soundfont_path: Optional[str] = None
     audio_driver: Optional[str] = None
+    preload_audio: bool = False  # Load the soundfont synchronously at startup instead of in the background
+    preload_programs: List[int] = field(default_factory=list)  # MIDI programs to load at startup
 
     # Logging
     log_level: str = "INFO"
@@ -56,10 +62,10 @@ class Config:
         if not (6 <= self.font_size <= 72):
             raise ValueError(f"Font size must be between 6 and 72, got {self.font_size}")
 
-        if self.notation not in ("american", "european"):
+        if self.notation not in _VALID_NOTATIONS:
             raise ValueError(f"Notation must be 'american' or 'european', got {self.notation}")
 
-        if self.log_level not in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
+        if self.log_level not in _VALID_LOG_LEVELS:
             raise ValueError(f"Invalid log level: {self.log_level}")
 
         if len(self.recent_files) > self.max_recent_files:
@@ -88,6 +94,8 @@ class Config:
             "max_recent_files": self.max_recent_files,
             "soundfont_path": self.soundfont_path,
             "audio_driver": self.audio_driver,
+            "preload_audio": self.preload_audio,
+            "preload_programs": self.preload_programs,
             "log_level": self.log_level,
             "show_quick_start_on_startup": self.show_quick_start_on_startup,
         }
@@ -120,6 +128,8 @@ class Config:
             max_recent_files=data.get("max_recent_files", 10),
             soundfont_path=data.get("soundfont_path"),
             audio_driver=data.get("audio_driver"),
+            preload_audio=data.get("preload_audio", False),
+            preload_programs=data.get("preload_programs", []),
             log_level=data.get("log_level", "INFO"),
             show_quick_start_on_startup=data.get("show_quick_start_on_startup", True),
         )
@@ -2,9 +2,10 @@
 Directive model for song instructions like BPM, time signature, etc.
 """
 
+import sys
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Optional
+from typing import ClassVar, Optional
 
 
 class DirectiveType(IntEnum):
@@ -33,6 +34,9 @@ class Directive:
     Directives are instructions like BPM, time signature, key changes, or loop markers.
     """
 
+    kind: ClassVar[int] = 1
+    """Item type tag shared with ChordInfo (0 = chord, 1 = directive)"""
+
     type: DirectiveType
     """The type of directive"""
 
@@ -70,27 +74,44 @@ class Directive:
     loop_count: int = 2
     """Number of times to loop (for DirectiveType.LOOP). Must be >= 1. Default is 2."""
 
+    def __post_init__(self) -> None:
+        """Intern key and label strings, which repeat throughout a song."""
+        if self.key is not None:
+            self.key = sys.intern(self.key)
+        if self.label is not None:
+            self.label = sys.intern(self.label)
+
     def __repr__(self) -> str:
         """String representation of the directive."""
-        if self.type == DirectiveType.BPM:
-            if self.bpm_modifier_type == BPMModifierType.ABSOLUTE:
-                return f"Directive(BPM={self.bpm})"
-            elif self.bpm_modifier_type == BPMModifierType.RELATIVE:
-                sign = "+" if self.bpm_modifier_value >= 0 else ""
-                return f"Directive(BPM={sign}{int(self.bpm_modifier_value)})"
-            elif self.bpm_modifier_type == BPMModifierType.PERCENTAGE:
-                return f"Directive(BPM={self.bpm_modifier_value}%)"
-            elif self.bpm_modifier_type == BPMModifierType.MULTIPLIER:
-                return f"Directive(BPM={self.bpm_modifier_value}x)"
-            elif self.bpm_modifier_type == BPMModifierType.RESET:
-                return f"Directive(BPM=reset)"
-            return f"Directive(BPM={self.bpm})"
-        elif self.type == DirectiveType.TIME_SIGNATURE:
-            return f"Directive(TIME_SIG={self.beats}/{self.unit})"
-        elif self.type == DirectiveType.KEY:
-            return f"Directive(KEY={self.key})"
-        elif self.type == DirectiveType.LOOP:
-            return f"Directive(LOOP={self.label}, count={self.loop_count})"
-        elif self.type == DirectiveType.LABEL:
-            return f"Directive(LABEL={self.label})"
-        return f"Directive(type={self.type})"
+        return _REPR_FNS[self.type](self)
+
+
+def _bpm_repr(directive: Directive) -> str:
+    """Format a BPM directive, dispatching on its modifier type."""
+    if directive.bpm_modifier_type is None:
+        return f"Directive(BPM={directive.bpm})"
+    return _BPM_REPR_FNS[directive.bpm_modifier_type](directive)
+
+
+def _bpm_relative_repr(directive: Directive) -> str:
+    """Format a relative BPM directive with an explicit sign."""
+    sign = "+" if directive.bpm_modifier_value >= 0 else ""
+    return f"Directive(BPM={sign}{int(directive.bpm_modifier_value)})"
+
+
+# Per-type formatters indexed by DirectiveType / BPMModifierType value, so
+# __repr__ is a single table lookup instead of an if/elif chain.
+_BPM_REPR_FNS = [None] * len(BPMModifierType)
+_BPM_REPR_FNS[BPMModifierType.ABSOLUTE] = lambda d: f"Directive(BPM={d.bpm})"
+_BPM_REPR_FNS[BPMModifierType.RELATIVE] = _bpm_relative_repr
+_BPM_REPR_FNS[BPMModifierType.PERCENTAGE] = lambda d: f"Directive(BPM={d.bpm_modifier_value}%)"
+_BPM_REPR_FNS[BPMModifierType.MULTIPLIER] = lambda d: f"Directive(BPM={d.bpm_modifier_value}x)"
+_BPM_REPR_FNS[BPMModifierType.RESET] = lambda d: "Directive(BPM=reset)"
+
+_REPR_FNS = [None] * len(DirectiveType)
+_REPR_FNS[DirectiveType.BPM] = _bpm_repr
+_REPR_FNS[DirectiveType.TIME_SIGNATURE] = lambda d: f"Directive(TIME_SIG={d.beats}/{d.unit})"
+_REPR_FNS[DirectiveType.KEY] = lambda d: f"Directive(KEY={d.key})"
+_REPR_FNS[DirectiveType.LOOP] = lambda d: f"Directive(LOOP={d.label}, count={d.loop_count})"
+_REPR_FNS[DirectiveType.LABEL] = lambda d: f"Directive(LABEL={d.label})"
+_REPR_FNS[DirectiveType.UNKNOWN] = lambda d: f"Directive(type={d.type})"
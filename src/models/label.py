@@ -5,11 +5,12 @@ Label model for marking positions in a song
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Label:
     """Represents a label marker in the song.
 
     Labels mark specific positions in the song, typically used with loop directives.
+    Labels are immutable and hashable.
     """
 
     name: str
@@ -44,6 +44,32 @@ class Line:
         if self.type == LineType.TEXT and self.items:
             self.items = []
 
+    @classmethod
+    def from_trusted(cls, content: str, line_number: int,
+                     type: Optional[LineType] = None,
+                     items: Optional[List[Union[ChordInfo, Directive]]] = None) -> 'Line':
+        """Create a line from already-validated data, bypassing __init__.
+
+        Intended for bulk construction (e.g. chord detection over a whole
+        document) where the caller guarantees line_number >= 1 and that
+        text lines carry no chord items.
+
+        Args:
+            content: The text content of the line
+            line_number: Line number (1-indexed)
+            type: Line type, or None if not yet classified
+            items: ChordInfo/Directive items (a new empty list if None)
+
+        Returns:
+            New Line instance
+        """
+        line = object.__new__(cls)
+        line.content = content
+        line.line_number = line_number
+        line.type = type
+        line.items = [] if items is None else items
+        return line
+
     def is_chord_line(self) -> bool:
         """Check if this is a chord line.
 
@@ -81,7 +107,7 @@ class Line:
         Returns:
             List of ChordInfo objects (filtering out directives)
         """
-        return [item for item in self.items if isinstance(item, ChordInfo)]
+        return [item for item in self.items if item.kind == 0]
 
     @property
     def directives(self) -> List[Directive]:
@@ -90,7 +116,7 @@ class Line:
         Returns:
             List of Directive objects (filtering out chords)
         """
-        return [item for item in self.items if isinstance(item, Directive)]
+        return [item for item in self.items if item.kind == 1]
 
     def get_valid_chords(self) -> List[ChordInfo]:
         """Get only the valid chords from this line.
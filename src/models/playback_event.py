@@ -16,7 +16,7 @@ class PlaybackEventType(Enum):
     PLAYBACK_FINISHED = "playback_finished"  # Playback has completed
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaybackEventArgs:
     """Event arguments for playback events.
 
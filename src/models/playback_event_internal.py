@@ -1,7 +1,8 @@
 """Internal playback event model for producer-consumer architecture."""
+from array import array
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional
 
 
 class MidiEventType(Enum):
@@ -12,7 +13,7 @@ class MidiEventType(Enum):
     END_OF_SONG = "end_of_song"
 
 
-@dataclass
+@dataclass(slots=True)
 class MidiEvent:
     """Represents a MIDI event with absolute timing.
 
@@ -22,13 +23,14 @@ class MidiEvent:
     Attributes:
         timestamp: Absolute time in seconds from the start of the song
         event_type: Type of MIDI event (NOTE_ON, NOTE_OFF, END_OF_SONG)
-        midi_notes: List of MIDI note numbers to play/stop
+        midi_notes: MIDI note numbers to play/stop, stored as a compact unsigned-byte
+            array (MIDI notes always fit in 0-127)
         velocity: MIDI velocity (0-127), typically used for NOTE_ON
         metadata: Optional metadata for UI callbacks (chord info, line/item indices)
     """
     timestamp: float
     event_type: MidiEventType
-    midi_notes: List[int] = field(default_factory=list)
+    midi_notes: array = field(default_factory=lambda: array('B'))
     velocity: int = 100
     metadata: Dict[str, Any] = field(default_factory=dict)
 
@@ -3,14 +3,22 @@ Playback state model for tracking dynamic playback context
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Any, Optional, List
 
 
-@dataclass
+# Field positions inside a loop stack frame:
+# [label, start_line, current_iteration, max_iterations]
+_LOOP_ITERATION = 2
+_LOOP_MAX_ITERATIONS = 3
+
+
+@dataclass(frozen=True)
 class LoopContext:
     """Represents a single loop level in the playback stack.
 
-    Used for tracking nested loops during song playback.
+    Used for tracking nested loops during song playback. PlaybackState keeps
+    its stack as plain list frames and hands out read-only LoopContext
+    snapshots; use PlaybackState.increment_loop() to advance a loop.
     """
 
     label: str
@@ -33,10 +41,6 @@ class LoopContext:
         """
         return self.current_iteration < self.max_iterations
 
-    def increment(self) -> None:
-        """Increment the current iteration counter."""
-        self.current_iteration += 1
-
     def __repr__(self) -> str:
         """String representation of the loop context."""
         return f"LoopContext(label='{self.label}', iteration={self.current_iteration}/{self.max_iterations})"
@@ -71,8 +75,11 @@ class PlaybackState:
     key: Optional[str] = None
     """Current key signature (e.g., 'C', 'Am', 'D')"""
 
-    loop_stack: List[LoopContext] = field(default_factory=list)
-    """Stack of active loop contexts (for nested loops)"""
+    loop_stack: List[List[Any]] = field(default_factory=list)
+    """Stack of active loop frames (for nested loops).
+
+    Each frame is a list of [label, start_line, current_iteration, max_iterations].
+    """
 
     def set_bpm(self, bpm: int) -> None:
         """Update the current BPM.
@@ -112,13 +119,7 @@ class PlaybackState:
             start_line: Line number where loop starts
             max_iterations: Total number of iterations
         """
-        loop_ctx = LoopContext(
-            label=label,
-            start_line=start_line,
-            current_iteration=1,
-            max_iterations=max_iterations
-        )
-        self.loop_stack.append(loop_ctx)
+        self.loop_stack.append([label, start_line, 1, max_iterations])
 
     def pop_loop(self) -> Optional[LoopContext]:
         """Exit the current loop context.
@@ -127,19 +128,36 @@ class PlaybackState:
             The popped LoopContext, or None if stack was empty
         """
         if self.loop_stack:
-            return self.loop_stack.pop()
+            return LoopContext(*self.loop_stack.pop())
         return None
 
     def current_loop(self) -> Optional[LoopContext]:
         """Get the current active loop without removing it.
 
         Returns:
-            The current LoopContext, or None if no active loops
+            A snapshot of the current LoopContext, or None if no active loops.
+            Use increment_loop() to advance the live loop.
         """
         if self.loop_stack:
-            return self.loop_stack[-1]
+            return LoopContext(*self.loop_stack[-1])
         return None
 
+    def loop_should_continue(self) -> bool:
+        """Check if the current loop has more iterations to perform.
+
+        Returns:
+            True if more iterations remain, False otherwise (or if not in a loop)
+        """
+        if self.loop_stack:
+            top = self.loop_stack[-1]
+            return top[_LOOP_ITERATION] < top[_LOOP_MAX_ITERATIONS]
+        return False
+
+    def increment_loop(self) -> None:
+        """Increment the iteration counter of the current loop."""
+        if self.loop_stack:
+            self.loop_stack[-1][_LOOP_ITERATION] += 1
+
     def is_in_loop(self) -> bool:
         """Check if currently inside a loop.
 
@@ -2,18 +2,31 @@
 Song model representing an entire song file
 """
 
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import List, Dict
-from models.line import Line
+from typing import List, Dict, Optional
+from models.line import Line, LineType
 from models.label import Label
 
 
-@dataclass
+# Per-line type codes stored in Song.line_types
+LINE_CODE_TEXT = 0
+LINE_CODE_CHORD = 1
+LINE_CODE_DIRECTIVE = 2  # Text line that only carries directives
+
+
+@dataclass(slots=True)
 class Song:
     """Represents an entire song made up of lines.
 
     A song contains all the lines of text/chords/directives and a dictionary
     of labels for navigation and loop markers.
+
+    Alongside the Line objects, the song keeps a compact structure-of-arrays
+    view (line_types, line_content_offsets) for bulk queries that would
+    otherwise touch every Line object. The arrays reflect each line as it was
+    when added, so lines should be added through add_line().
     """
 
     lines: List[Line] = field(default_factory=list)
@@ -22,6 +35,56 @@ class Song:
     labels: Dict[str, Label] = field(default_factory=dict)
     """Dictionary of labels, keyed by label name"""
 
+    line_types: bytearray = field(init=False, repr=False, default_factory=bytearray)
+    """Type code of each line (LINE_CODE_TEXT, LINE_CODE_CHORD or LINE_CODE_DIRECTIVE)"""
+
+    line_content_offsets: array = field(init=False, repr=False, default_factory=lambda: array('i'))
+    """Character offset of each line's start within the song text"""
+
+    _label_lines: List[int] = field(init=False, repr=False, default_factory=list)
+    """Line numbers of all labels, sorted ascending"""
+
+    _label_names_by_line: List[str] = field(init=False, repr=False, default_factory=list)
+    """Label names in the same order as _label_lines"""
+
+    def __post_init__(self) -> None:
+        """Build the per-line arrays and label index for constructor arguments."""
+        for line in self.lines:
+            self._index_line(line)
+        for label in self.labels.values():
+            self._index_label(label)
+
+    def _index_line(self, line: Line) -> None:
+        """Append a line's type code and content offset to the per-line arrays."""
+        if line.type == LineType.CHORD:
+            code = LINE_CODE_CHORD
+        elif line.items:
+            code = LINE_CODE_DIRECTIVE
+        else:
+            code = LINE_CODE_TEXT
+
+        offsets = self.line_content_offsets
+        if offsets:
+            previous = self.lines[len(offsets) - 1]
+            offsets.append(offsets[-1] + len(previous.content) + 1)  # +1 for newline
+        else:
+            offsets.append(0)
+        self.line_types.append(code)
+
+    def _index_label(self, label: Label) -> None:
+        """Insert a label into the sorted line-number index."""
+        index = bisect_right(self._label_lines, label.line_number)
+        self._label_lines.insert(index, label.line_number)
+        self._label_names_by_line.insert(index, label.name)
+
+    def _unindex_label(self, label: Label) -> None:
+        """Remove a label from the sorted line-number index."""
+        index = bisect_right(self._label_lines, label.line_number) - 1
+        while self._label_names_by_line[index] != label.name:
+            index -= 1
+        del self._label_lines[index]
+        del self._label_names_by_line[index]
+
     def add_line(self, line: Line) -> None:
         """Add a line to the song.
 
@@ -29,6 +92,7 @@ class Song:
             line: Line object to add
         """
         self.lines.append(line)
+        self._index_line(line)
 
     def add_label(self, label: Label) -> None:
         """Add a label to the song.
@@ -36,7 +100,11 @@ class Song:
         Args:
             label: Label object to add
         """
+        previous = self.labels.get(label.name)
+        if previous is not None:
+            self._unindex_label(previous)
         self.labels[label.name] = label
+        self._index_label(label)
 
     def get_label(self, name: str) -> Label | None:
         """Get a label by name.
@@ -49,13 +117,52 @@ class Song:
         """
         return self.labels.get(name)
 
+    def next_label_after(self, line_number: int) -> Optional[Label]:
+        """Get the first label on a line after the given line.
+
+        Args:
+            line_number: Line number (1-indexed) to search after
+
+        Returns:
+            The nearest following Label, or None if there is none
+        """
+        index = bisect_right(self._label_lines, line_number)
+        if index < len(self._label_lines):
+            return self.labels[self._label_names_by_line[index]]
+        return None
+
+    def line_indices_of_type(self, code: int) -> List[int]:
+        """Get the indices of all lines with the given type code.
+
+        Args:
+            code: LINE_CODE_TEXT, LINE_CODE_CHORD or LINE_CODE_DIRECTIVE
+
+        Returns:
+            Zero-based line indices, in order
+        """
+        indices = []
+        find = self.line_types.find
+        index = find(code)
+        while index != -1:
+            indices.append(index)
+            index = find(code, index + 1)
+        return indices
+
+    def chord_line_indices(self) -> List[int]:
+        """Get the indices of all chord lines.
+
+        Returns:
+            Zero-based line indices of chord lines, in order
+        """
+        return self.line_indices_of_type(LINE_CODE_CHORD)
+
     def line_count(self) -> int:
         """Get the total number of lines in the song.
 
         Returns:
             Number of lines
         """
-        return len(self.lines)
+        return len(self.line_types)
 
     def __repr__(self) -> str:
         """String representation of the song."""
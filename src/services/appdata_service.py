@@ -1,24 +1,60 @@
 """Application data directory management service."""
 
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
 
 from constants import APP_ID, CONFIG_FILENAME, LOG_FILENAME
 
 
+@dataclass(frozen=True)
+class _PlatformDirs:
+    """Resolved application directories for the current platform."""
+
+    app_data: Path
+    config: Path
+    logs: Path
+    cache: Path
+
+
+def _resolve_platform_dirs() -> _PlatformDirs:
+    """Resolve the application directories for the current platform.
+
+    Returns:
+        _PlatformDirs with:
+        - Linux: ~/.local/share/chord-notepad (app data), ~/.config/chord-notepad (config)
+        - macOS: ~/Library/Application Support/ChordNotepad (both)
+        - Windows: %APPDATA%/ChordNotepad (both)
+    """
+    home = Path.home()
+    if sys.platform == "win32":
+        app_data = home / "AppData" / "Roaming" / "ChordNotepad"
+        config = app_data
+    elif sys.platform == "darwin":
+        app_data = home / "Library" / "Application Support" / "ChordNotepad"
+        config = app_data
+    else:  # Linux and other Unix-like systems
+        app_data = home / ".local" / "share" / APP_ID
+        config = home / ".config" / APP_ID
+
+    return _PlatformDirs(
+        app_data=app_data,
+        config=config,
+        logs=app_data / "logs",
+        cache=app_data / "cache",
+    )
+
+
+# Resolved once at import; the home directory and platform don't change at runtime
+_PLATFORM_DIRS = _resolve_platform_dirs()
+
+
 class AppDataService:
     """Manages application data directories and paths.
 
     Provides platform-specific directory resolution for config, logs, and cache.
     """
 
-    def __init__(self):
-        self._app_data_dir: Optional[Path] = None
-        self._config_dir: Optional[Path] = None
-        self._logs_dir: Optional[Path] = None
-        self._cache_dir: Optional[Path] = None
-
     def get_app_data_dir(self) -> Path:
         """Get the main application data directory.
 
@@ -28,18 +64,7 @@ class AppDataService:
             - macOS: ~/Library/Application Support/ChordNotepad
             - Windows: %APPDATA%/ChordNotepad
         """
-        if self._app_data_dir is None:
-            if sys.platform == "win32":
-                base = Path.home() / "AppData" / "Roaming"
-                self._app_data_dir = base / "ChordNotepad"
-            elif sys.platform == "darwin":
-                base = Path.home() / "Library" / "Application Support"
-                self._app_data_dir = base / "ChordNotepad"
-            else:  # Linux and other Unix-like systems
-                base = Path.home() / ".local" / "share"
-                self._app_data_dir = base / APP_ID
-
-        return self._app_data_dir
+        return _PLATFORM_DIRS.app_data
 
     def get_config_dir(self) -> Path:
         """Get the configuration directory.
@@ -50,14 +75,7 @@ class AppDataService:
             - macOS: ~/Library/Application Support/ChordNotepad
             - Windows: %APPDATA%/ChordNotepad
         """
-        if self._config_dir is None:
-            if sys.platform == "win32" or sys.platform == "darwin":
-                # On Windows and macOS, config is in the same location as app data
-                self._config_dir = self.get_app_data_dir()
-            else:  # Linux
-                self._config_dir = Path.home() / ".config" / APP_ID
-
-        return self._config_dir
+        return _PLATFORM_DIRS.config
 
     def get_logs_dir(self) -> Path:
         """Get the logs directory.
@@ -65,10 +83,7 @@ class AppDataService:
         Returns:
             Path: {app_data_dir}/logs
         """
-        if self._logs_dir is None:
-            self._logs_dir = self.get_app_data_dir() / "logs"
-
-        return self._logs_dir
+        return _PLATFORM_DIRS.logs
 
     def get_cache_dir(self) -> Path:
         """Get the cache directory.
@@ -76,22 +91,20 @@ class AppDataService:
         Returns:
             Path: {app_data_dir}/cache
         """
-        if self._cache_dir is None:
-            self._cache_dir = self.get_app_data_dir() / "cache"
-
-        return self._cache_dir
+        return _PLATFORM_DIRS.cache
 
     def ensure_directories_exist(self) -> None:
         """Create all necessary directories if they don't exist."""
-        directories = [
-            self.get_app_data_dir(),
-            self.get_config_dir(),
-            self.get_logs_dir(),
-            self.get_cache_dir(),
-        ]
-
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+        app_data_dir = self.get_app_data_dir()
+        app_data_dir.mkdir(parents=True, exist_ok=True)
+
+        # Logs and cache live directly under the app data dir, which now exists
+        self.get_logs_dir().mkdir(exist_ok=True)
+        self.get_cache_dir().mkdir(exist_ok=True)
+
+        config_dir = self.get_config_dir()
+        if config_dir != app_data_dir:
+            config_dir.mkdir(parents=True, exist_ok=True)
 
     def get_config_file_path(self, filename: str = CONFIG_FILENAME) -> Path:
         """Get the full path to a config file.
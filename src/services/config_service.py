@@ -1,7 +1,9 @@
 """Configuration persistence service."""
 
+import copy
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, Optional
 
@@ -9,17 +11,67 @@ from models.config import Config
 from exceptions import ConfigurationError
 from services.appdata_service import AppDataService
 from constants import CONFIG_VERSION
+from utils.observable import Observable
 
+# orjson is optional; it parses/serializes config much faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class ConfigService:
+
+def _read_json(path: Path) -> Any:
+    """Read and parse a JSON file.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Atomically write data to a file as pretty-printed UTF-8 JSON.
+
+    The data is written to a temporary file next to the target, which then
+    replaces the target, so an interrupted save never leaves a truncated file.
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class ConfigService(Observable):
     """Manages application configuration loading and saving.
 
     Handles JSON serialization/deserialization and provides type-safe access.
+    Consumers that cache a setting can observe(key, callback) to be told when
+    set() or reset_to_defaults() changes it.
     """
 
     def __init__(self, appdata_service: AppDataService):
+        super().__init__()
         self._appdata_service = appdata_service
         self._config: Optional[Config] = None
+        # Direct reference to self._config.__dict__ for fast get() lookups
+        self._cfg_dict: Optional[dict] = None
+        # Snapshot of what is known to be on disk, used to skip no-op saves
+        self._last_saved_dict: Optional[dict] = None
         self._config_file_path: Path = appdata_service.get_config_file_path()
         self._logger = logging.getLogger(__name__)
 
@@ -37,23 +89,24 @@ class ConfigService:
 
         try:
             if self._config_file_path.exists():
-                self._logger.info(f"Loading configuration from {self._config_file_path}")
-                with open(self._config_file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                self._logger.info("Loading configuration from %s", self._config_file_path)
+                data = _read_json(self._config_file_path)
 
                 # Check if migration is needed
                 config_version = data.get("version", 1)
                 if config_version < CONFIG_VERSION:
-                    self._logger.info(f"Migrating config from version {config_version} to {CONFIG_VERSION}")
+                    self._logger.info("Migrating config from version %s to %s", config_version, CONFIG_VERSION)
                     data = self._migrate_config(data, config_version)
 
                 self._config = Config.from_dict(data)
-                self._logger.debug(f"Configuration loaded successfully")
+                self._logger.debug("Configuration loaded successfully")
 
                 # Save if migration occurred
                 if config_version < CONFIG_VERSION:
                     self._logger.info("Saving migrated configuration")
                     self.save_config()
+                else:
+                    self._last_saved_dict = copy.deepcopy(self._config.to_dict())
             else:
                 self._logger.info("No configuration file found, using defaults")
                 self._config = Config()
@@ -64,13 +117,14 @@ class ConfigService:
             self._config.validate()
 
         except json.JSONDecodeError as e:
-            self._logger.error(f"Failed to parse configuration file: {e}")
+            self._logger.error("Failed to parse configuration file: %s", e)
             raise ConfigurationError(f"Configuration file is corrupted: {e}")
         except Exception as e:
-            self._logger.error(f"Error loading configuration: {e}")
+            self._logger.error("Error loading configuration: %s", e)
             # Fall back to defaults on any error
             self._config = Config()
 
+        self._cfg_dict = self._config.__dict__
         return self._config
 
     def save_config(self, config: Optional[Config] = None) -> None:
@@ -84,6 +138,7 @@ class ConfigService:
         """
         if config is not None:
             self._config = config
+            self._cfg_dict = config.__dict__
 
         if self._config is None:
             raise ConfigurationError("No configuration to save")
@@ -92,19 +147,25 @@ class ConfigService:
             # Validate before saving
             self._config.validate()
 
-            self._logger.debug(f"Saving configuration to {self._config_file_path}")
+            current = self._config.to_dict()
+            if current == self._last_saved_dict:
+                self._logger.debug("Configuration unchanged, skipping save")
+                return
+
+            self._logger.debug("Saving configuration to %s", self._config_file_path)
 
             # Ensure directory exists
             self._config_file_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Write to file with pretty formatting
-            with open(self._config_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self._config.to_dict(), f, indent=2, ensure_ascii=False)
+            _write_json(self._config_file_path, current)
 
+            # Deep copy so in-place edits to list/dict values are seen as changes
+            self._last_saved_dict = copy.deepcopy(current)
             self._logger.debug("Configuration saved successfully")
 
         except Exception as e:
-            self._logger.error(f"Failed to save configuration: {e}")
+            self._logger.error("Failed to save configuration: %s", e)
             raise ConfigurationError(f"Failed to save configuration: {e}")
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -117,10 +178,12 @@ class ConfigService:
         Returns:
             Configuration value or default
         """
-        if self._config is None:
+        cfg_dict = self._cfg_dict
+        if cfg_dict is None:
             self.load_config()
+            cfg_dict = self._cfg_dict
 
-        return getattr(self._config, key, default)
+        return cfg_dict.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """Set a configuration value.
@@ -132,21 +195,31 @@ class ConfigService:
         Raises:
             ConfigurationError: If key doesn't exist or value is invalid
         """
-        if self._config is None:
+        cfg_dict = self._cfg_dict
+        if cfg_dict is None:
             self.load_config()
+            cfg_dict = self._cfg_dict
 
-        if not hasattr(self._config, key):
+        if key not in cfg_dict:
             raise ConfigurationError(f"Unknown configuration key: {key}")
 
         setattr(self._config, key, value)
-        self._logger.debug(f"Configuration updated: {key} = {value}")
+        self._logger.debug("Configuration updated: %s = %s", key, value)
+
+        # Always notify: a list or dict edited in place and written back
+        # compares equal to the stored value even though it has changed
+        self.notify(key, value)
 
     def reset_to_defaults(self) -> None:
         """Reset configuration to default values."""
         self._logger.info("Resetting configuration to defaults")
         self._config = Config()
+        self._cfg_dict = self._config.__dict__
         self.save_config()
 
+        for key in list(self._observers):
+            self.notify(key, self._cfg_dict.get(key))
+
     @property
     def config(self) -> Config:
         """Get the current configuration object.
@@ -1,7 +1,9 @@
 """Event producer for pre-computing MIDI events in a separate thread."""
 import logging
 import threading
-from typing import List, Optional, Callable, Tuple
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Callable, Set, Tuple
 from queue import Queue
 
 from models.line import Line
@@ -12,7 +14,66 @@ from models.playback_event import PlaybackEventArgs, PlaybackEventType
 from models.playback_event_internal import MidiEvent, MidiEventType
 from audio.event_buffer import EventBuffer
 from audio.note_picker_interface import INotePicker
-from audio.chord_picker import ChordPickerState
+
+
+# Event times are accumulated as integer nanoseconds so long songs and
+# repeated loops don't drift; events still carry float seconds
+_NS_PER_SECOND = 1_000_000_000
+_NS_PER_MINUTE = 60 * _NS_PER_SECOND
+
+# Song positions and chord durations are counted in integer ticks, so bar
+# numbers are exact integer divisions however long the song plays
+_TICKS_PER_BEAT = 480
+
+# Item kinds assigned by EventProducer._flatten. A directive's kind is
+# 1 + its DirectiveType, so it indexes the producer's dispatch table directly.
+_KIND_CHORD = 0
+
+# Directives whose effect is fully replaced by a later directive of the same
+# type, so runs of them between chords can be folded (see _flatten)
+_COALESCED_DIRECTIVES = frozenset({DirectiveType.BPM, DirectiveType.TIME_SIGNATURE, DirectiveType.KEY})
+_OVERRIDING_BPM_MODIFIERS = frozenset({BPMModifierType.ABSOLUTE, BPMModifierType.RESET})
+
+
+@dataclass(slots=True)
+class LoopFrame:
+    """An active loop on the production state's loop stack."""
+    label: str
+    count: int
+    remaining: int
+    target: int
+
+
+@dataclass(slots=True)
+class LabelState:
+    """Production state saved at a label's first encounter, restored by loops."""
+    saved: bool = False
+    bpm: int = 0
+    time_sig: Tuple[int, int] = (4, 4)
+    key: Optional[str] = None
+    chord_picker_state: object = None
+
+
+@dataclass(slots=True)
+class ProductionState:
+    """Mutable state of the event production walk over the song."""
+    current_key: Optional[str] = None
+    current_time_sig: Tuple[int, int] = (4, 4)
+    total_bars: int = 1
+    line_index: int = 0
+    index: int = 0
+    items: list = field(default_factory=list)
+    kinds: bytearray = field(default_factory=bytearray)
+    item_lines: List[int] = field(default_factory=list)
+    durations: List[Optional[int]] = field(default_factory=list)
+    labels: Dict[str, int] = field(default_factory=dict)
+    label_states: Dict[str, LabelState] = field(default_factory=dict)
+    loop_stack: List[LoopFrame] = field(default_factory=list)
+    active_loop_labels: Set[str] = field(default_factory=set)
+    current_bar: int = 1
+    position_ticks: int = 0
+    start_index: int = 0
+    in_playback_range: bool = False
 
 
 class EventProducer:
@@ -63,6 +124,8 @@ class EventProducer:
         self._application = application
         self._player = player
         self._on_event_callback = on_event_callback
+        # Callback data is only attached to events when someone will read it
+        self._has_callback = on_event_callback is not None
         self._logger = logger or logging.getLogger(__name__)
         self._start_line_index = start_line_index
         self._start_item_index = start_item_index
@@ -70,7 +133,30 @@ class EventProducer:
         self._thread = None
         self._stop_event = threading.Event()
         self._current_bpm = initial_bpm
-        self._current_time_position = 0.0  # Absolute time in seconds
+        self._current_time_ns = 0  # Absolute time in nanoseconds
+        # Callback metadata shared by every event until a directive changes
+        # BPM, key or time signature (rebuilt lazily by _get_segment_metadata)
+        self._segment_metadata: Optional[dict] = None
+
+        # Loops replay the same few chords many times; resolve each one only once
+        from chord.helper import ChordHelper
+        self._chord_helper = ChordHelper()
+        self._resolve_cache: Dict[Tuple[str, Optional[str], bool], Optional[ChordNotes]] = {}
+        # Canonical packed MIDI notes per voicing
+        self._midi_intern: Dict[Tuple[int, ...], array] = {}
+
+        # Directive handlers indexed by item kind (see _flatten)
+        directive_handlers = {
+            DirectiveType.BPM: self._handle_bpm_directive,
+            DirectiveType.TIME_SIGNATURE: self._handle_time_signature_directive,
+            DirectiveType.KEY: self._handle_key_directive,
+            DirectiveType.LOOP: self._handle_loop_directive,
+            DirectiveType.LABEL: self._handle_label_directive,
+        }
+        self._kind_dispatch: List[Optional[Callable[[Directive, ProductionState], None]]] = (
+            [None]
+            + [directive_handlers.get(t, self._ignore_directive) for t in DirectiveType]
+        )
 
     def start(self) -> None:
         """Start the event producer thread."""
@@ -80,7 +166,8 @@ class EventProducer:
 
         self._stop_event.clear()
         self._current_bpm = self._initial_bpm
-        self._current_time_position = 0.0
+        self._current_time_ns = 0
+        self._segment_metadata = None
         self._thread = threading.Thread(target=self._produce_events, daemon=True, name="EventProducer")
         self._thread.start()
         self._logger.info("Event producer started")
@@ -99,43 +186,24 @@ class EventProducer:
     def _produce_events(self) -> None:
         """Main event production loop (runs in separate thread)."""
         try:
-            # Calculate total bars for UI progress
-            total_beats = 0.0
-            for line in self._lines:
-                for item in line.items:
-                    if isinstance(item, ChordInfo) and item.is_valid:
-                        duration = float(item.duration) if item.duration is not None else float(self._initial_time_sig[0])
-                        total_beats += duration
-            total_bars = max(1, int(total_beats / self._initial_time_sig[0]))
-
             # Initialize state
-            state = {
-                'lines': self._lines,
-                'line_index': 0,
-                'item_index': 0,
-                'current_key': self._initial_key,
-                'current_time_sig': self._initial_time_sig,
-                'loop_stack': [],
-                'labels': {},
-                'label_states': {},
-                'current_bar': 1,
-                'total_bars': total_bars,
-                'current_beat_position': 0.0,
-                'start_line_index': self._start_line_index,
-                'start_item_index': self._start_item_index,
-                'in_playback_range': self._start_line_index == 0 and self._start_item_index == 0
-            }
+            state = ProductionState(
+                current_key=self._initial_key,
+                current_time_sig=self._initial_time_sig
+            )
 
-            # Build label index
-            self._build_label_index(state)
+            # Flatten the song into a single item sequence with a label index
+            # (also counts the total bars for UI progress)
+            self._flatten(state)
+            state.in_playback_range = state.start_index == 0
 
             # Generate events
             while not self._stop_event.is_set():
-                event = self._get_next_event(state)
-                if event is None:
+                events = self._get_next_events(state)
+                if events is None:
                     # End of song - push END_OF_SONG event
                     end_event = MidiEvent(
-                        timestamp=self._current_time_position,
+                        timestamp=self._current_time_ns / _NS_PER_SECOND,
                         event_type=MidiEventType.END_OF_SONG
                     )
                     try:
@@ -145,229 +213,291 @@ class EventProducer:
                         self._logger.debug("Buffer closed while sending END_OF_SONG")
                     break
 
-                # Push event to buffer (blocks if buffer is full - this is intentional)
+                # Push events to buffer (blocks if buffer is full - this is intentional)
                 # No timeout - producer should wait for consumer to make space
                 try:
-                    self._event_buffer.push_event(event)
+                    self._event_buffer.push_events(events)
                 except ValueError:
                     # Buffer was closed - stop producing
                     self._logger.debug("Buffer closed, stopping event production")
                     break
 
         except Exception as e:
-            self._logger.error(f"Error in event producer: {e}", exc_info=True)
+            self._logger.error("Error in event producer: %s", e, exc_info=True)
         finally:
             self._logger.info("Event producer finished")
 
-    def _build_label_index(self, state: dict) -> None:
-        """Build an index of labels for loop jumps."""
-        for line_idx, line in enumerate(state['lines']):
-            for item_idx, item in enumerate(line.items):
-                if isinstance(item, Directive) and item.type == DirectiveType.LABEL:
-                    state['labels'][item.label] = (line_idx, item_idx)
-                    self._logger.debug(f"Found label '{item.label}' at line {line_idx}, item {item_idx}")
+    def _flatten(self, state: ProductionState) -> None:
+        """Flatten all line items into a single sequence for event production.
+
+        Populates state with:
+            items: Every valid chord and directive, in song order
+            kinds: Dispatch kind of each item (_KIND_CHORD or a directive kind)
+            item_lines: Line index of each item
+            durations: Explicit chord duration in ticks, or None for a full measure
+            labels: Label name -> index into items, used as loop jump target
+            label_states: Label name -> unsaved LabelState, filled at the label
+            start_index: Index of the first item inside the playback range
+            total_bars: Song length in bars at the initial time signature
+
+        A BPM, key or time signature directive that is overridden by a later one
+        of the same type before the next chord, label or loop is replaced by it,
+        so only the effective value is applied during production.
+        """
+        items = []
+        kinds = bytearray()
+        item_lines = []
+        durations = []
+        labels = state.labels
+        label_states = state.label_states
+        start_index = None
+        ticks_per_measure = self._initial_time_sig[0] * _TICKS_PER_BEAT
+        total_ticks = 0
+        chord_count = 0
+        # Directive type -> index of its latest directive since the last chord
+        pending: Dict[DirectiveType, int] = {}
+
+        for line_idx, line in enumerate(self._lines):
+            is_start_line = line_idx == self._start_line_index
 
-    def _get_next_event(self, state: dict) -> Optional[MidiEvent]:
-        """Get next MIDI event (processes directives, returns chord event).
+            for item_idx, item in enumerate(line.items):
+                if is_start_line and item_idx == self._start_item_index:
+                    start_index = len(items)
+
+                # Invalid items never play, so they are left out entirely
+                if not item.is_valid:
+                    self._logger.debug("Skipping invalid item at position %d", item.start)
+                    continue
+
+                duration = None
+                if item.kind == ChordInfo.kind:
+                    pending.clear()
+                    kinds.append(_KIND_CHORD)
+                    chord_count += 1
+                    if item.duration is not None:
+                        duration = round(item.duration * _TICKS_PER_BEAT)
+                    total_ticks += duration if duration is not None else ticks_per_measure
+                else:
+                    directive_type = item.type
+                    if directive_type in _COALESCED_DIRECTIVES:
+                        pending_index = pending.get(directive_type)
+                        if pending_index is not None and (
+                            directive_type != DirectiveType.BPM
+                            or item.bpm_modifier_type in _OVERRIDING_BPM_MODIFIERS
+                        ):
+                            items[pending_index] = item
+                            continue
+                        pending[directive_type] = len(items)
+                    else:
+                        # Labels save the state and loops restore it
+                        pending.clear()
+
+                    kinds.append(1 + directive_type)
+                    if directive_type == DirectiveType.LABEL:
+                        labels[item.label] = len(items)
+                        if item.label not in label_states:
+                            label_states[item.label] = LabelState()
+                        self._logger.debug("Found label '%s' at line %d, item %d", item.label, line_idx, len(items))
+
+                items.append(item)
+                item_lines.append(line_idx)
+                durations.append(duration)
+
+            # A start item past the end of its line starts at the next line
+            if is_start_line and start_index is None:
+                start_index = len(items)
+
+        state.items = items
+        state.kinds = kinds
+        state.item_lines = item_lines
+        state.durations = durations
+        state.start_index = start_index if start_index is not None else len(items)
+        state.total_bars = max(1, total_ticks // ticks_per_measure)
+        self._logger.info("Song has %d chords in %d bars", chord_count, state.total_bars)
+
+    def _get_next_events(self, state: ProductionState) -> Optional[Tuple[MidiEvent, ...]]:
+        """Get the MIDI events of the next chord (processes directives on the way).
 
         Args:
-            state: Production state dictionary
+            state: Production state
 
         Returns:
-            MidiEvent or None when done
+            (NOTE_ON, NOTE_OFF) or (REST,) events, or None when done
         """
-        # Check if there's a pending NOTE_OFF event to send first
-        if 'pending_note_off' in state and state['pending_note_off']:
-            event = state['pending_note_off']
-            state['pending_note_off'] = None
-            return event
-
+        items = state.items
+        kinds = state.kinds
+        item_lines = state.item_lines
+        durations = state.durations
+        kind_dispatch = self._kind_dispatch
         while True:
             # Check if we've reached the end
-            if state['line_index'] >= len(state['lines']):
+            index = state.index
+            if index >= len(items):
                 return None
 
-            line = state['lines'][state['line_index']]
-
-            # Check if we've processed all items in this line
-            if state['item_index'] >= len(line.items):
-                state['line_index'] += 1
-                state['item_index'] = 0
-                continue
-
-            item = line.items[state['item_index']]
-            current_line_idx = state['line_index']
-            current_item_idx = state['item_index']
-            state['item_index'] += 1
+            item = items[index]
+            state.index = index + 1
+            state.line_index = item_lines[index]
 
             # Check if we've reached the start position
-            if not state['in_playback_range']:
-                if (current_line_idx > state['start_line_index'] or
-                    (current_line_idx == state['start_line_index'] and
-                     current_item_idx >= state['start_item_index'])):
-                    state['in_playback_range'] = True
-                    self._logger.debug(f"Entered playback range at line {current_line_idx}, item {current_item_idx}")
+            if not state.in_playback_range and index >= state.start_index:
+                state.in_playback_range = True
+                self._logger.debug("Entered playback range at line %d, item %d", state.line_index, index)
 
             # Process directives (always process, regardless of playback range)
-            if isinstance(item, Directive):
-                self._handle_directive(item, state)
+            kind = kinds[index]
+            if kind != _KIND_CHORD:
+                kind_dispatch[kind](item, state)
                 continue
 
             # Process chords
-            elif isinstance(item, ChordInfo):
-                if state['in_playback_range']:
+            else:
+                # Chords without an explicit duration last a full measure
+                duration_ticks = durations[index]
+                if duration_ticks is None:
+                    duration_ticks = state.current_time_sig[0] * _TICKS_PER_BEAT
+
+                if state.in_playback_range:
                     # In playback range - create and return events
-                    events = self._create_chord_events(item, state)
+                    events = self._create_chord_events(item, duration_ticks, state)
                     if events:
-                        first_event, second_event = events
-                        # REST events have no NOTE_OFF (second_event is None)
-                        if second_event is not None:
-                            state['pending_note_off'] = second_event
-                        return first_event
-                    # If event is None, chord couldn't be played, continue to next
+                        return events
+                    # If events is None, chord couldn't be played, continue to next
                 else:
                     # Not in playback range yet - update counters but don't play
-                    self._update_position_for_chord(item, state)
+                    self._update_position_for_chord(item, duration_ticks, state)
                 continue
 
         return None
 
-    def _handle_directive(self, directive: Directive, state: dict) -> None:
-        """Handle a directive during event production."""
-        # Skip invalid directives
-        if not directive.is_valid:
-            self._logger.debug(f"Skipping invalid directive at position {directive.start}")
-            return
+    def _ignore_directive(self, directive: Directive, state: ProductionState) -> None:
+        """Ignore a directive type that has no effect on event production."""
 
-        if directive.type == DirectiveType.BPM:
-            self._handle_bpm_directive(directive)
-        elif directive.type == DirectiveType.KEY:
-            self._handle_key_directive(directive, state)
-        elif directive.type == DirectiveType.TIME_SIGNATURE:
-            self._handle_time_signature_directive(directive, state)
-        elif directive.type == DirectiveType.LOOP:
-            self._handle_loop_directive(directive, state)
-        elif directive.type == DirectiveType.LABEL:
-            self._handle_label_directive(directive, state)
-
-    def _handle_bpm_directive(self, directive: Directive) -> None:
+    def _handle_bpm_directive(self, directive: Directive, state: ProductionState) -> None:
         """Handle BPM directive with support for multiple modifier types."""
         new_bpm = self._current_bpm
 
         if directive.bpm_modifier_type == BPMModifierType.ABSOLUTE:
             new_bpm = directive.bpm
-            self._logger.debug(f"Directive: Setting BPM to {new_bpm}")
+            self._logger.debug("Directive: Setting BPM to %s", new_bpm)
 
         elif directive.bpm_modifier_type == BPMModifierType.RELATIVE:
             new_bpm = int(self._current_bpm + directive.bpm_modifier_value)
-            self._logger.debug(f"Directive: Adjusting BPM by {directive.bpm_modifier_value:+.0f} "
-                             f"({self._current_bpm} -> {new_bpm})")
+            self._logger.debug("Directive: Adjusting BPM by %+.0f (%s -> %s)",
+                               directive.bpm_modifier_value, self._current_bpm, new_bpm)
 
         elif directive.bpm_modifier_type == BPMModifierType.PERCENTAGE:
             new_bpm = int(self._current_bpm * directive.bpm_modifier_value / 100)
-            self._logger.debug(f"Directive: Setting BPM to {directive.bpm_modifier_value}% "
-                             f"({self._current_bpm} -> {new_bpm})")
+            self._logger.debug("Directive: Setting BPM to %s%% (%s -> %s)",
+                               directive.bpm_modifier_value, self._current_bpm, new_bpm)
 
         elif directive.bpm_modifier_type == BPMModifierType.MULTIPLIER:
             new_bpm = int(self._current_bpm * directive.bpm_modifier_value)
-            self._logger.debug(f"Directive: Multiplying BPM by {directive.bpm_modifier_value}x "
-                             f"({self._current_bpm} -> {new_bpm})")
+            self._logger.debug("Directive: Multiplying BPM by %sx (%s -> %s)",
+                               directive.bpm_modifier_value, self._current_bpm, new_bpm)
 
         elif directive.bpm_modifier_type == BPMModifierType.RESET:
             new_bpm = self._initial_bpm
-            self._logger.debug(f"Directive: Resetting BPM to initial value "
-                             f"({self._current_bpm} -> {new_bpm})")
+            self._logger.debug("Directive: Resetting BPM to initial value (%s -> %s)",
+                               self._current_bpm, new_bpm)
 
         self._current_bpm = new_bpm
+        self._segment_metadata = None
 
         # Update player's BPM
         if self._player:
             self._player.set_bpm(new_bpm)
 
-    def _handle_key_directive(self, directive: Directive, state: dict) -> None:
+    def _handle_key_directive(self, directive: Directive, state: ProductionState) -> None:
         """Handle key change directive."""
-        self._logger.debug(f"Directive: Setting key to {directive.key}")
-        state['current_key'] = directive.key
+        self._logger.debug("Directive: Setting key to %s", directive.key)
+        state.current_key = directive.key
+        self._segment_metadata = None
 
-    def _handle_time_signature_directive(self, directive: Directive, state: dict) -> None:
+    def _handle_time_signature_directive(self, directive: Directive, state: ProductionState) -> None:
         """Handle time signature directive."""
-        self._logger.debug(f"Directive: Setting time signature to {directive.beats}/{directive.unit}")
-        state['current_time_sig'] = (directive.beats, directive.unit)
+        self._logger.debug("Directive: Setting time signature to %s/%s", directive.beats, directive.unit)
+        state.current_time_sig = (directive.beats, directive.unit)
+        self._segment_metadata = None
 
         # Update player's time signature
         if self._player:
             self._player.set_time_signature(directive.beats, directive.unit)
 
-    def _handle_loop_directive(self, directive: Directive, state: dict) -> None:
+    def _handle_loop_directive(self, directive: Directive, state: ProductionState) -> None:
         """Handle loop directive (restore state and jump to label)."""
-        if directive.label in state['labels']:
-            label_pos = state['labels'][directive.label]
+        if directive.label in state.labels:
+            label_pos = state.labels[directive.label]
 
             # Check if we're already in a loop for this label
-            already_looping = any(loop['label'] == directive.label for loop in state['loop_stack'])
+            already_looping = directive.label in state.active_loop_labels
 
             if not already_looping:
                 # First time hitting loop directive - initialize loop
-                self._logger.debug(f"Directive: Loop to label '{directive.label}' {directive.loop_count} times")
+                self._logger.debug("Directive: Loop to label '%s' %s times", directive.label, directive.loop_count)
 
                 # Restore the saved state from the label before jumping back
-                if directive.label in state['label_states']:
-                    saved_state = state['label_states'][directive.label]
-                    self._logger.debug(f"Restoring state at loop: BPM={saved_state['bpm']}, "
-                                     f"time_sig={saved_state['time_sig']}, key={saved_state['key']}")
-                    self._current_bpm = saved_state['bpm']
-                    state['current_time_sig'] = saved_state['time_sig']
-                    state['current_key'] = saved_state['key']
+                saved_state = state.label_states[directive.label]
+                if saved_state.saved:
+                    self._logger.debug("Restoring state at loop: BPM=%s, time_sig=%s, key=%s",
+                                       saved_state.bpm, saved_state.time_sig, saved_state.key)
+                    self._current_bpm = saved_state.bpm
+                    state.current_time_sig = saved_state.time_sig
+                    state.current_key = saved_state.key
+                    self._segment_metadata = None
 
                     # Update player with restored state
                     if self._player:
-                        self._player.set_bpm(saved_state['bpm'])
-                        self._player.set_time_signature(saved_state['time_sig'][0], saved_state['time_sig'][1])
+                        self._player.set_bpm(saved_state.bpm)
+                        self._player.set_time_signature(saved_state.time_sig[0], saved_state.time_sig[1])
 
                     # Restore chord picker state for consistent voice leading
-                    self._note_picker.state = ChordPickerState.from_dict(saved_state['chord_picker_state'])
-
-                state['loop_stack'].append({
-                    'label': directive.label,
-                    'count': directive.loop_count,
-                    'remaining': directive.loop_count - 1,
-                    'target': label_pos
-                })
+                    # (the state setter stores its own copy, so the snapshot stays intact)
+                    self._note_picker.state = saved_state.chord_picker_state
+
+                state.loop_stack.append(LoopFrame(
+                    label=directive.label,
+                    count=directive.loop_count,
+                    remaining=directive.loop_count - 1,
+                    target=label_pos
+                ))
+                state.active_loop_labels.add(directive.label)
                 # Jump to label
-                state['line_index'], state['item_index'] = label_pos
+                state.index = label_pos
             # else: We're already looping, so we'll hit the label which handles continuation
         else:
-            self._logger.warning(f"Label '{directive.label}' not found for loop")
+            self._logger.warning("Label '%s' not found for loop", directive.label)
 
-    def _handle_label_directive(self, directive: Directive, state: dict) -> None:
+    def _handle_label_directive(self, directive: Directive, state: ProductionState) -> None:
         """Handle label directive (save state on first encounter, check loop completion)."""
         # First time encountering this label - save the current production state
-        if directive.label not in state['label_states']:
-            saved_state = {
-                'bpm': self._current_bpm,
-                'time_sig': state['current_time_sig'],
-                'key': state['current_key'],
-                'chord_picker_state': self._note_picker.state.to_dict()
-            }
-            state['label_states'][directive.label] = saved_state
-            self._logger.debug(f"Saved state at label '{directive.label}': BPM={saved_state['bpm']}, "
-                             f"time_sig={saved_state['time_sig']}, key={saved_state['key']}")
+        saved_state = state.label_states[directive.label]
+        if not saved_state.saved:
+            saved_state.saved = True
+            saved_state.bpm = self._current_bpm
+            saved_state.time_sig = state.current_time_sig
+            saved_state.key = state.current_key
+            # The state getter already returns an independent copy
+            saved_state.chord_picker_state = self._note_picker.state
+            self._logger.debug("Saved state at label '%s': BPM=%s, time_sig=%s, key=%s", directive.label,
+                               saved_state.bpm, saved_state.time_sig, saved_state.key)
 
         # Check if we're in a loop and need to continue or finish
-        if state['loop_stack']:
-            current_loop = state['loop_stack'][-1]
+        if state.loop_stack:
+            current_loop = state.loop_stack[-1]
             # Check if this is the label we're looping on
-            if current_loop['label'] == directive.label:
-                if current_loop['remaining'] > 0:
-                    self._logger.debug(f"Continuing loop '{directive.label}' ({current_loop['remaining']} more times)")
-                    current_loop['remaining'] -= 1
+            if current_loop.label == directive.label:
+                if current_loop.remaining > 0:
+                    self._logger.debug("Continuing loop '%s' (%s more times)", directive.label, current_loop.remaining)
+                    current_loop.remaining -= 1
                     # Continue playing from after the label
                 else:
                     # Loop finished
-                    self._logger.debug(f"Loop '{directive.label}' finished")
-                    state['loop_stack'].pop()
+                    self._logger.debug("Loop '%s' finished", directive.label)
+                    state.loop_stack.pop()
+                    state.active_loop_labels.discard(directive.label)
 
-    def _update_position_for_chord(self, chord: ChordInfo, state: dict) -> None:
+    def _update_position_for_chord(self, chord: ChordInfo, duration_ticks: int, state: ProductionState) -> None:
         """Update beat position counter for a chord without playing it.
 
         This is used when skipping chords before the playback start position,
@@ -376,151 +506,165 @@ class EventProducer:
 
         Args:
             chord: ChordInfo object
-            state: Production state dictionary
+            duration_ticks: Duration of the chord in ticks
+            state: Production state
         """
-        if not chord.is_valid:
-            return
+        # Update ONLY beat position for bar counting
+        # Do NOT update _current_time_ns so playback starts immediately
+        state.position_ticks += duration_ticks
 
-        # Determine duration in beats
-        if chord.duration is not None:
-            duration_beats = float(chord.duration)
-        else:
-            # Default to full measure
-            duration_beats = float(state['current_time_sig'][0])
+    def _get_segment_metadata(self, state: ProductionState) -> dict:
+        """Get the callback metadata that stays constant between directives.
 
-        # Update ONLY beat position for bar counting
-        # Do NOT update _current_time_position so playback starts immediately
-        state['current_beat_position'] += duration_beats
+        Args:
+            state: Production state
 
-    def _create_chord_events(self, chord: ChordInfo, state: dict) -> Optional[Tuple[MidiEvent, MidiEvent]]:
+        Returns:
+            Dictionary with BPM, time signature, key, total bars and callback flag
+        """
+        segment_metadata = self._segment_metadata
+        if segment_metadata is None:
+            time_sig = state.current_time_sig
+            segment_metadata = {
+                'bpm': self._current_bpm,
+                'time_signature_beats': time_sig[0],
+                'time_signature_unit': time_sig[1],
+                'key': state.current_key,
+                'total_bars': state.total_bars,
+                'has_callback': True
+            }
+            self._segment_metadata = segment_metadata
+        return segment_metadata
+
+    def _create_chord_events(self, chord: ChordInfo, duration_ticks: int,
+                             state: ProductionState) -> Optional[Tuple[MidiEvent, ...]]:
         """Create MIDI events (NOTE_ON and NOTE_OFF, or REST) for a chord.
 
         Args:
             chord: ChordInfo object
-            state: Production state dictionary
+            duration_ticks: Duration of the chord in ticks
+            state: Production state
 
         Returns:
-            Tuple of (NOTE_ON event, NOTE_OFF event) or (REST event, None) for NC,
+            Tuple of (NOTE_ON event, NOTE_OFF event) or (REST event,) for NC,
             or None if chord can't be played
         """
-        if not chord.is_valid:
-            self._logger.warning(f"Skipping invalid chord: {chord.chord}")
-            return None
-
-        # Determine duration in beats
-        if chord.duration is not None:
-            duration_beats = float(chord.duration)
-        else:
-            # Default to full measure
-            duration_beats = float(state['current_time_sig'][0])
-
-        # Calculate duration in seconds
-        beats_per_second = self._current_bpm / 60.0
-        duration_seconds = duration_beats / beats_per_second
+        # Calculate duration (exact integer nanoseconds, plus seconds for metadata)
+        duration_ns = duration_ticks * _NS_PER_MINUTE // (self._current_bpm * _TICKS_PER_BEAT)
+        duration_seconds = duration_ns / _NS_PER_SECOND
+        start_ns = self._current_time_ns
+        end_ns = start_ns + duration_ns
+        timestamp = start_ns / _NS_PER_SECOND
 
         # Calculate current bar number based on beat position
-        time_sig_beats = state['current_time_sig'][0]
-        current_bar = int(state['current_beat_position'] / time_sig_beats) + 1
+        position_ticks = state.position_ticks
+        current_bar = position_ticks // (state.current_time_sig[0] * _TICKS_PER_BEAT) + 1
+        line_index = state.line_index
 
         # Handle NC (No Chord / rest) - create REST event
         if chord.is_rest:
+            metadata = {
+                'chord_info': chord,
+                'duration_seconds': duration_seconds,
+                'line_index': line_index,
+                'bar': current_bar
+            }
+            if self._has_callback:
+                metadata.update(self._get_segment_metadata(state))
+
             rest_event = MidiEvent(
-                timestamp=self._current_time_position,
+                timestamp=timestamp,
                 event_type=MidiEventType.REST,
-                midi_notes=[],
                 velocity=0,
-                metadata={
-                    'chord_info': chord,
-                    'duration_seconds': duration_seconds,
-                    'line_index': state['line_index'],
-                    'bar': current_bar,
-                    # Callback data
-                    'bpm': self._current_bpm,
-                    'time_signature_beats': state['current_time_sig'][0],
-                    'time_signature_unit': state['current_time_sig'][1],
-                    'key': state['current_key'],
-                    'total_bars': state['total_bars'],
-                    'has_callback': self._on_event_callback is not None
-                }
+                metadata=metadata
             )
 
             # Update time position and beat position
-            self._current_time_position += duration_seconds
-            state['current_beat_position'] += duration_beats
+            self._current_time_ns = end_ns
+            state.position_ticks = position_ticks + duration_ticks
 
-            self._logger.debug(f"Created REST event for NC at t={rest_event.timestamp:.3f}s "
-                             f"(duration={duration_seconds:.3f}s)")
-            return (rest_event, None)
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug("Created REST event for NC at t=%.3fs (duration=%.3fs)",
+                                   rest_event.timestamp, duration_seconds)
+            return (rest_event,)
 
         # Resolve chord to notes
-        chord_notes = self._resolve_chord_notes(chord, state['current_key'])
+        chord_notes = self._resolve_chord_notes(chord, state.current_key)
         if not chord_notes:
-            self._logger.warning(f"Could not resolve chord: {chord.chord}")
+            self._logger.warning("Could not resolve chord: %s", chord.chord)
             return None
 
         # Convert to MIDI
         midi_notes = self._notes_to_midi(chord_notes)
         if not midi_notes:
-            self._logger.warning(f"Could not convert chord to MIDI: {chord.chord}")
+            self._logger.warning("Could not convert chord to MIDI: %s", chord.chord)
             return None
 
+        # Pack into a compact byte array shared by the NOTE_ON/NOTE_OFF pair, and
+        # by every other occurrence of the same voicing (events never mutate it)
+        voicing = tuple(midi_notes)
+        midi_notes = self._midi_intern.get(voicing)
+        if midi_notes is None:
+            midi_notes = self._midi_intern[voicing] = array('B', voicing)
+
         # Create NOTE_ON event at current time
         # Store callback data in metadata - Player will fire the callback when event is played
+        metadata = {
+            'chord_info': chord,
+            'chord_notes': chord_notes,
+            'duration_seconds': duration_seconds,
+            'line_index': line_index,
+            'bar': current_bar
+        }
+        if self._has_callback:
+            metadata.update(self._get_segment_metadata(state))
+
         note_on_event = MidiEvent(
-            timestamp=self._current_time_position,
+            timestamp=timestamp,
             event_type=MidiEventType.NOTE_ON,
             midi_notes=midi_notes,
             velocity=100,
-            metadata={
-                'chord_info': chord,
-                'chord_notes': chord_notes,
-                'duration_seconds': duration_seconds,
-                'line_index': state['line_index'],
-                'bar': current_bar,
-                # Callback data
-                'bpm': self._current_bpm,
-                'time_signature_beats': state['current_time_sig'][0],
-                'time_signature_unit': state['current_time_sig'][1],
-                'key': state['current_key'],
-                'total_bars': state['total_bars'],
-                'has_callback': self._on_event_callback is not None
-            }
+            metadata=metadata
         )
 
         # Create NOTE_OFF event at end of duration
         note_off_event = MidiEvent(
-            timestamp=self._current_time_position + duration_seconds,
+            timestamp=end_ns / _NS_PER_SECOND,
             event_type=MidiEventType.NOTE_OFF,
             midi_notes=midi_notes,
             velocity=0,
             metadata={
                 'chord_info': chord,
-                'line_index': state['line_index'] - 1,
+                'line_index': line_index - 1,
                 'bar': current_bar
             }
         )
 
         # Update time position and beat position
-        self._current_time_position += duration_seconds
-        state['current_beat_position'] += duration_beats
+        self._current_time_ns = end_ns
+        state.position_ticks = position_ticks + duration_ticks
 
-        self._logger.debug(f"Created events for {chord.chord}: NOTE_ON at t={note_on_event.timestamp:.3f}s, "
-                         f"NOTE_OFF at t={note_off_event.timestamp:.3f}s (duration={duration_seconds:.3f}s)")
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Created events for %s: NOTE_ON at t=%.3fs, NOTE_OFF at t=%.3fs (duration=%.3fs)",
+                               chord.chord, note_on_event.timestamp, note_off_event.timestamp, duration_seconds)
         return (note_on_event, note_off_event)
 
     def _resolve_chord_notes(self, chord: ChordInfo, current_key: Optional[str]) -> Optional[ChordNotes]:
         """Resolve a chord to its note names based on current key."""
-        from chord.helper import ChordHelper
-
-        helper = ChordHelper()
         # Only pass key for relative (roman numeral) chords
         key_to_use = current_key if chord.is_relative else None
-        chord_notes_result = helper.compute_chord_notes(
+        cache_key = (chord.chord, key_to_use, chord.is_relative)
+        try:
+            return self._resolve_cache[cache_key]
+        except KeyError:
+            pass
+
+        chord_notes_result = self._chord_helper.compute_chord_notes(
             chord.chord,
             key=key_to_use,
             is_relative=chord.is_relative
         )
-
+        self._resolve_cache[cache_key] = chord_notes_result
         return chord_notes_result
 
     def _notes_to_midi(self, chord_notes: ChordNotes) -> Optional[List[int]]:
@@ -529,5 +673,5 @@ class EventProducer:
             midi_notes = self._note_picker.chord_to_midi(chord_notes)
             return midi_notes
         except Exception as e:
-            self._logger.error(f"Error converting notes to MIDI: {e}", exc_info=True)
+            self._logger.error("Error converting notes to MIDI: %s", e, exc_info=True)
             return None
@@ -15,6 +15,10 @@ class FileService:
     def __init__(self, config_service: ConfigService):
         self._config = config_service
         self._logger = logging.getLogger(__name__)
+        # Recent files as last validated against the filesystem; only
+        # re-checked on an explicit refresh or when the setting changes elsewhere
+        self._recent_files: Optional[List[Path]] = None
+        self._config.observe("recent_files", self._on_recent_files_changed)
 
     def open_file(self, path: Path) -> str:
         """Open and read a file.
@@ -85,12 +89,19 @@ class FileService:
             self._logger.error(f"Error writing file: {e}", exc_info=True)
             raise FileOperationError(f"Failed to write file: {e}")
 
-    def get_recent_files(self) -> List[Path]:
+    def get_recent_files(self, force_refresh: bool = False) -> List[Path]:
         """Get list of recently opened files.
 
+        Args:
+            force_refresh: Re-check that each file still exists instead of
+                returning the cached list
+
         Returns:
             List of file paths (most recent first)
         """
+        if self._recent_files is not None and not force_refresh:
+            return list(self._recent_files)
+
         recent_files_str = self._config.get("recent_files", [])
         recent_files = [Path(p) for p in recent_files_str if p]
 
@@ -101,7 +112,8 @@ class FileService:
         if len(existing_files) != len(recent_files):
             self._config.set("recent_files", [str(f) for f in existing_files])
 
-        return existing_files
+        self._recent_files = existing_files
+        return list(existing_files)
 
     def add_recent_file(self, path: Path) -> None:
         """Add a file to the recent files list.
@@ -110,7 +122,8 @@ class FileService:
             path: File path to add
         """
         recent_files = self.get_recent_files()
-        path_str = str(path.resolve())
+        # abspath is string-only; resolve() would stat every path component
+        path_str = os.path.abspath(path)
 
         # Remove if already in list
         recent_files_str = [str(f) for f in recent_files if str(f) != path_str]
@@ -124,13 +137,19 @@ class FileService:
 
         # Save to config
         self._config.set("recent_files", recent_files_str)
+        self._recent_files = [Path(p) for p in recent_files_str]
         self._logger.debug(f"Added to recent files: {path}")
 
     def clear_recent_files(self) -> None:
         """Clear the recent files list."""
         self._config.set("recent_files", [])
+        self._recent_files = []
         self._logger.info("Cleared recent files list")
 
+    def _on_recent_files_changed(self, value: List[str]) -> None:
+        """Drop the cached recent files when the setting is changed."""
+        self._recent_files = None
+
     def file_exists(self, path: Path) -> bool:
         """Check if a file exists.
 
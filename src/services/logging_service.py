@@ -1,118 +1,458 @@
 """Logging configuration and management service."""
 
 import logging
+import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from constants import (
     LOG_MAX_BYTES,
     LOG_BACKUP_COUNT,
+    LOG_BUFFER_CAPACITY,
+    LOG_FLUSH_INTERVAL,
     DEFAULT_LOG_LEVEL,
     APP_NAME,
 )
 from services.appdata_service import AppDataService
 
+logger = logging.getLogger(__name__)
+
+# Accepted level names and their numeric values
+_LEVEL_MAP = {
+    name: getattr(logging, name)
+    for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+
+
+def _parse_level(level: str) -> int:
+    """Convert a level name such as "info" to its numeric value.
+
+    Raises:
+        ValueError: If the name is not a supported log level
+    """
+    try:
+        return _LEVEL_MAP[level.upper()]
+    except KeyError:
+        raise ValueError(f"Invalid log level: {level}") from None
+
+
+class FastFormatter(logging.Formatter):
+    """Formats records as '<time> [<LEVEL>] <logger>: <message>'.
+
+    Produces the same output as the format string
+    '%(asctime)s [%(levelname)s] %(name)s: %(message)s', but builds the line
+    directly, formats the timestamp only once per second (when a datefmt is
+    given) and reuses the " [LEVEL] logger: " part for each level/logger pair.
+    """
+
+    # Upper bound on cached prefixes, in case logger names are generated
+    _MAX_PREFIXES = 4096
+
+    def __init__(self, datefmt: Optional[str] = None):
+        super().__init__(datefmt=datefmt)
+        # (whole second, date format, formatted timestamp) of the last record
+        self._time_cache: tuple = (None, None, '')
+        self._prefix_cache: Dict[Tuple[int, str], str] = {}
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the record's creation time, reusing the last result within a second."""
+        if datefmt is None:
+            # The default format includes milliseconds, so it can't be reused
+            return super().formatTime(record)
+        second = int(record.created)
+        cached = self._time_cache
+        if cached[0] != second or cached[1] != datefmt:
+            cached = (second, datefmt, super().formatTime(record, datefmt))
+            self._time_cache = cached
+        return cached[2]
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record, appending exception and stack information if present."""
+        # Records from the queue arrive pre-merged, with a str msg and no args
+        msg = record.msg
+        if type(msg) is not str or record.args:
+            msg = record.getMessage()
+        record.message = msg
+        key = (record.levelno, record.name)
+        prefix = self._prefix_cache.get(key)
+        if prefix is None:
+            prefix = f" [{record.levelname}] {record.name}: "
+            if len(self._prefix_cache) < self._MAX_PREFIXES:
+                self._prefix_cache[key] = prefix
+        line = self.formatTime(record, self.datefmt) + prefix + record.message
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line = f"{line}\n{record.exc_text}"
+        if record.stack_info:
+            line = f"{line}\n{self.formatStack(record.stack_info)}"
+        return line
+
+
+class CountingRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that tracks the file size itself.
+
+    The stdlib handler formats every record twice and stats, seeks and tells
+    on the file to decide whether to roll over. This one counts the encoded
+    bytes it writes and formats each record once. Records are left in the
+    stream's buffer rather than flushed one by one; call flush() to write
+    them out.
+    """
+
+    # Write buffer size for the log file, so batches reach the OS in large writes
+    _BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Never roll over anything other than a regular file (e.g. /dev/null)
+        self._rotatable = not os.path.exists(self.baseFilename) or os.path.isfile(self.baseFilename)
+        self._bytes_written = self._file_size()
+
+    def _file_size(self) -> int:
+        """Return the current size of the log file, or 0 if it can't be read."""
+        try:
+            return os.path.getsize(self.baseFilename)
+        except OSError:
+            return 0
+
+    def _open(self):
+        """Open the log file with a large write buffer."""
+        return self._builtin_open(
+            self.baseFilename, self.mode, buffering=self._BUFFER_SIZE,
+            encoding=self.encoding, errors=self.errors
+        )
+
+    def _encoded_size(self, msg: str) -> int:
+        """Return the number of bytes msg takes up in the log file."""
+        return len(msg.encode(self.encoding or 'utf-8', self.errors or 'strict'))
+
+    def _would_exceed(self, size: int) -> bool:
+        """Check whether writing size more bytes would exceed the limit."""
+        return (self._rotatable and self.maxBytes > 0 and self._bytes_written > 0
+                and self._bytes_written + size >= self.maxBytes)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Check whether writing the record would exceed the size limit."""
+        return self._would_exceed(self._encoded_size(self.format(record) + self.terminator))
+
+    def doRollover(self) -> None:
+        """Roll over the file and reset the size count."""
+        super().doRollover()
+        self._bytes_written = self._file_size()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record, rolling over first if it would exceed the size limit."""
+        try:
+            msg = self.format(record) + self.terminator
+            size = self._encoded_size(msg)
+            if self._would_exceed(size):
+                self.doRollover()
+
+            if self.stream is None:
+                if self.mode != 'w' or not self._closed:
+                    self.stream = self._open()
+            if self.stream:
+                self.stream.write(msg)
+                self._bytes_written += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BatchingMemoryHandler(MemoryHandler):
+    """MemoryHandler that flushes its target once per batch.
+
+    Buffered records are handed to the target together and the target is
+    flushed afterwards, so a batch costs a few large writes instead of one
+    write per record.
+    """
+
+    def flush(self) -> None:
+        """Send buffered records to the target, then flush the target."""
+        self.acquire()
+        try:
+            super().flush()
+            if self.target:
+                self.target.flush()
+        finally:
+            self.release()
+
+
+class ByteStreamHandler(logging.StreamHandler):
+    """StreamHandler that writes encoded bytes to a binary stream.
+
+    Used with sys.stdout.buffer to skip the text layer of sys.stdout, which
+    takes its own lock and re-encodes every write.
+    """
+
+    def __init__(self, stream, encoding: str = 'utf-8'):
+        super().__init__(stream)
+        self.encoding = encoding
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Encode and write a record."""
+        try:
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg.encode(self.encoding, 'backslashreplace'))
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
 
 class LoggingService:
     """Configures and manages application logging.
 
-    Sets up rotating file handlers and console output.
+    Sets up rotating file handlers and console output. Records are handed to
+    a queue on the calling thread and written by a background listener, so
+    logging never blocks on formatting or file I/O. File output is buffered
+    and written in batches, immediately on errors and at least once a second.
     """
 
+    __slots__ = (
+        "_configured",
+        "_log_file_path",
+        "_listener",
+        "_buffered_handler",
+        "_flush_stop",
+        "_flush_thread",
+        "_console_handler",
+        "_handler_cache_key",
+        "_level_sensitive_handlers",
+    )
+
+    # Owning service and handlers by (log file path, console output), shared
+    # across instances
+    _handler_cache: Dict[
+        Tuple[str, bool],
+        Tuple['LoggingService', Tuple[Optional[MemoryHandler], Optional[logging.Handler]]]
+    ] = {}
+
     def __init__(self):
         self._configured = False
         self._log_file_path: Optional[Path] = None
+        self._listener: Optional[QueueListener] = None
+        self._buffered_handler: Optional[MemoryHandler] = None
+        self._flush_stop = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._console_handler: Optional[logging.Handler] = None
+        # Handlers that follow the runtime log level; the file always gets DEBUG
+        self._level_sensitive_handlers: List[logging.Handler] = []
+        self._handler_cache_key: Optional[Tuple[str, bool]] = None
 
     def configure_logging(
         self,
         appdata_service: AppDataService,
         log_level: str = DEFAULT_LOG_LEVEL,
-        console_output: bool = True
+        console_output: bool = True,
+        force_console: bool = False
     ) -> None:
         """Configure the logging system.
 
         Args:
             appdata_service: Service to get log file paths
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-            console_output: Whether to output logs to console
+            console_output: Whether to output logs to console. Ignored when
+                stdout is not a terminal (redirected, or absent in the
+                windowed build) unless force_console is set.
+            force_console: Output logs to console even if stdout is not a terminal
+
+        Raises:
+            ValueError: If log_level is not a supported log level
         """
         if self._configured:
             return
 
+        level = _parse_level(log_level)
+
         # Get log file path
         self._log_file_path = appdata_service.get_log_file_path()
 
         # Create root logger
         root_logger = logging.getLogger()
-        root_logger.setLevel(getattr(logging, log_level.upper()))
+        root_logger.setLevel(level)
 
         # Clear any existing handlers
         root_logger.handlers.clear()
 
-        # Create formatter
-        formatter = logging.Formatter(
-            fmt='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+        # Skip console output nobody will see
+        if console_output and not force_console:
+            console_output = sys.stdout is not None and sys.stdout.isatty()
+
+        # Reuse handlers (and their open log file) from an earlier configuration
+        cache_key = (str(self._log_file_path), console_output)
+        entry = LoggingService._handler_cache.get(cache_key)
+        if entry is None:
+            cached = self._create_handlers(console_output)
+        else:
+            owner, cached = entry
+            owner._release_handlers()
+        if cached[0] is not None:
+            LoggingService._handler_cache[cache_key] = (self, cached)
+        self._handler_cache_key = cache_key
+        self._buffered_handler, self._console_handler = cached
+        self._level_sensitive_handlers = [h for h in (self._console_handler,) if h is not None]
+        for handler in self._level_sensitive_handlers:
+            handler.setLevel(level)
+
+        # Handlers run on the listener thread; the root logger only enqueues
+        handlers = [handler for handler in cached if handler is not None]
+
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(QueueHandler(log_queue))
+        self._listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+        self._start_flusher()
+
+        self._configured = True
+
+        # Log initialization
+        logger.info(
+            "%s logging initialized\n  Log level: %s\n  Log file: %s",
+            APP_NAME, log_level, self._log_file_path
         )
 
+    def _create_handlers(
+        self,
+        console_output: bool
+    ) -> Tuple[Optional[MemoryHandler], Optional[logging.Handler]]:
+        """Create the file and console handlers.
+
+        Args:
+            console_output: Whether to create a console handler
+
+        Returns:
+            Tuple of (buffered file handler, console handler); either is None
+            if not created
+        """
+        formatter = FastFormatter(datefmt='%Y-%m-%d %H:%M:%S')
+        buffered_handler = None
+        console_handler = None
+
         # Add rotating file handler
         try:
-            file_handler = RotatingFileHandler(
-                filename=self._log_file_path,
+            file_handler = CountingRotatingFileHandler(
+                filename=str(self._log_file_path),
                 maxBytes=LOG_MAX_BYTES,
                 backupCount=LOG_BACKUP_COUNT,
                 encoding='utf-8'
             )
             file_handler.setLevel(logging.DEBUG)  # Always log everything to file
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
+
+            # Batch file writes; errors are written out straight away
+            buffered_handler = BatchingMemoryHandler(
+                capacity=LOG_BUFFER_CAPACITY,
+                flushLevel=logging.ERROR,
+                target=file_handler,
+                flushOnClose=True
+            )
         except Exception as e:
             print(f"Warning: Could not create log file handler: {e}", file=sys.stderr)
 
         # Add console handler if requested
         if console_output:
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(getattr(logging, log_level.upper()))
+            stdout = sys.stdout
+            if hasattr(stdout, 'buffer'):
+                console_handler = ByteStreamHandler(stdout.buffer, stdout.encoding or 'utf-8')
+            else:
+                console_handler = logging.StreamHandler(stdout)
             console_handler.setFormatter(formatter)
-            root_logger.addHandler(console_handler)
 
-        self._configured = True
-
-        # Log initialization
-        logger = logging.getLogger(__name__)
-        logger.info(f"{APP_NAME} logging initialized")
-        logger.info(f"Log level: {log_level}")
-        logger.info(f"Log file: {self._log_file_path}")
+        return buffered_handler, console_handler
 
-    def get_logger(self, name: str) -> logging.Logger:
-        """Get a logger instance for a specific module.
-
-        Args:
-            name: Logger name (typically __name__)
-
-        Returns:
-            Logger instance
-        """
-        return logging.getLogger(name)
+    # get_logger(name) -> logging.Logger: get a logger for a module (typically
+    # __name__). Bound directly to logging.getLogger to skip a wrapper call.
+    get_logger = staticmethod(logging.getLogger)
 
     def set_log_level(self, level: str) -> None:
         """Change the logging level at runtime.
 
         Args:
             level: New log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+
+        Raises:
+            ValueError: If level is not a supported log level
         """
-        log_level = getattr(logging, level.upper())
+        log_level = _parse_level(level)
         logging.getLogger().setLevel(log_level)
 
-        # Update console handler level if it exists
-        for handler in logging.getLogger().handlers:
-            if isinstance(handler, logging.StreamHandler) and not isinstance(handler, RotatingFileHandler):
-                handler.setLevel(log_level)
+        for handler in self._level_sensitive_handlers:
+            handler.setLevel(log_level)
+
+        logger.info("Log level changed to %s", level)
+        self.flush()
+
+    def flush(self) -> None:
+        """Write buffered file records out to the log file."""
+        if self._buffered_handler is not None:
+            self._buffered_handler.flush()
+
+    def shutdown(self) -> None:
+        """Stop the background listener, writing out any queued records.
+
+        Closes the handlers this instance owns; handlers taken over by another
+        instance are left alone. Safe to call more than once.
+        """
+        self._stop_flusher()
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._handler_cache_key is None:
+            return
+
+        LoggingService._handler_cache.pop(self._handler_cache_key, None)
+        self._handler_cache_key = None
+        if self._buffered_handler is not None:
+            file_handler = self._buffered_handler.target
+            self._buffered_handler.close()  # Flushes buffered records first
+            if file_handler is not None:
+                file_handler.close()
+        if self._console_handler is not None:
+            self._console_handler.close()
+        self._forget_handlers()
+
+    def _release_handlers(self) -> None:
+        """Stop feeding the shared handlers so another instance can take them over."""
+        self._stop_flusher()
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        self._handler_cache_key = None
+        self._forget_handlers()
+
+    def _forget_handlers(self) -> None:
+        """Drop this instance's references to its handlers."""
+        self._buffered_handler = None
+        self._console_handler = None
+        self._level_sensitive_handlers = []
+
+    def _start_flusher(self) -> None:
+        """Start the thread that periodically flushes the file buffer."""
+        self._flush_stop.clear()
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, name="LogFlusher", daemon=True
+        )
+        self._flush_thread.start()
+
+    def _stop_flusher(self) -> None:
+        """Stop the flusher thread and wait for it to exit."""
+        self._flush_stop.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+            self._flush_thread = None
 
-        logger = logging.getLogger(__name__)
-        logger.info(f"Log level changed to {level}")
+    def _flush_loop(self) -> None:
+        """Flush the file buffer every LOG_FLUSH_INTERVAL until stopped."""
+        while not self._flush_stop.wait(LOG_FLUSH_INTERVAL):
+            self.flush()
 
     @property
     def log_file_path(self) -> Optional[Path]:
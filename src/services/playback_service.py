@@ -1,7 +1,8 @@
 """Audio playback service wrapping NotePlayer."""
 
 import logging
-from typing import Optional, List, Callable, Tuple
+import threading
+from typing import Dict, Hashable, Optional, List, Callable, Tuple
 
 from audio.player_interface import IPlayer
 from audio.player import NotePlayer
@@ -13,11 +14,13 @@ from services.event_producer import EventProducer
 from models.chord_notes import ChordNotes
 from models.chord import ChordInfo
 from models.playback_state import PlaybackState
-from models.playback_event import PlaybackEventArgs, PlaybackEventType
+from models.playback_event import PlaybackEventArgs
 from models.line import Line
-from models.directive import Directive, DirectiveType, BPMModifierType
 from services.config_service import ConfigService
 
+# Upper bound on remembered chord resolutions (click-to-play sees whatever the user types)
+_RESOLVE_CACHE_SIZE = 512
+
 
 class PlaybackService:
     """High-level audio playback orchestration service.
@@ -28,12 +31,22 @@ class PlaybackService:
     def __init__(self, config_service: ConfigService, player: Optional[IPlayer] = None, application=None):
         self._config = config_service
         self._player: Optional[IPlayer] = player
+        # Pickers by tuning, so switching back to a voicing reuses its picker
+        self._picker_cache: Dict[Hashable, INotePicker] = {}
         self._note_picker = self._create_note_picker(self._config.get("voicing", "piano"))
         self._logger = logging.getLogger(__name__)
         self._initialized = player is not None
+        self._init_thread: Optional[threading.Thread] = None
+        self._init_done = threading.Event()
+        self._current_program: Optional[int] = None  # Program selected on the player
         self._playback_state = PlaybackState()
         self._application = application  # For UI callbacks
 
+        # Chord resolution is a pure function of (chord, key, is_relative); the
+        # helper is created on first use since it pulls in music21
+        self._chord_helper = None
+        self._resolve_cache: Dict[Tuple[str, Optional[str], bool], Optional[ChordNotes]] = {}
+
         # Producer-consumer components
         self._event_buffer: Optional[EventBuffer] = None
         self._event_producer: Optional[EventProducer] = None
@@ -45,7 +58,7 @@ class PlaybackService:
             voicing: Voicing string like 'piano', 'guitar:standard', 'guitar:drop_d', etc.
 
         Returns:
-            INotePicker instance
+            INotePicker instance (shared with earlier calls for the same tuning)
         """
         if voicing.startswith("guitar:"):
             # Extract tuning from voicing string
@@ -59,10 +72,18 @@ class PlaybackService:
                 # Use built-in tuning
                 tuning = tuning_name
 
-            return GuitarChordPicker(tuning=tuning)
+            # Key on the tuning itself, so an edited custom tuning gets a new picker
+            cache_key = ("guitar", tuning if isinstance(tuning, str) else tuple(tuning))
+            picker = self._picker_cache.get(cache_key)
+            if picker is None:
+                picker = self._picker_cache[cache_key] = GuitarChordPicker(tuning=tuning)
+            return picker
         else:
             # Default to piano voicing
-            return ChordNotePicker()
+            picker = self._picker_cache.get("piano")
+            if picker is None:
+                picker = self._picker_cache["piano"] = ChordNotePicker()
+            return picker
 
     def set_voicing(self, voicing: str) -> None:
         """Change the voicing style.
@@ -70,7 +91,10 @@ class PlaybackService:
         Args:
             voicing: Voicing string like 'piano', 'guitar:standard', etc.
         """
-        self._logger.debug(f"Setting voicing to {voicing}")
+        if voicing == self._config.get("voicing"):
+            return
+
+        self._logger.debug("Setting voicing to %s", voicing)
         self._note_picker = self._create_note_picker(voicing)
         self._config.set("voicing", voicing)
 
@@ -84,15 +108,6 @@ class PlaybackService:
             return self._player.get_available_instruments()
         return []
 
-    def set_instrument(self, program: int) -> None:
-        """Change the MIDI instrument.
-
-        Args:
-            program: MIDI program number (0-127)
-        """
-        if self._player:
-            self._player.set_instrument(program)
-
     def initialize_player(self, soundfont_path: Optional[str] = None) -> bool:
         """Initialize the audio player.
 
@@ -131,18 +146,58 @@ class PlaybackService:
 
             # Set instrument from config
             instrument = self._config.get("instrument", 0)
+            self._player.load_program(instrument)
             self._player.set_instrument(instrument)
+            self._current_program = instrument
+
+            # Warm up any programs the user wants available without a load delay
+            for program in self._config.get("preload_programs", []):
+                self._player.load_program(program)
 
             self._initialized = True
             self._logger.info("Audio player initialized successfully")
             return True
 
         except Exception as e:
-            self._logger.error(f"Failed to initialize audio player: {e}", exc_info=True)
+            self._logger.error("Failed to initialize audio player: %s", e, exc_info=True)
             self._player = None
             self._initialized = False
             return False
 
+    def initialize_player_async(self, soundfont_path: Optional[str] = None) -> None:
+        """Start initializing the audio player on a background thread.
+
+        Loading the soundfont is the slowest part of startup, so it is done off
+        the UI thread. Playback calls wait for it to finish via _ensure_initialized().
+
+        Args:
+            soundfont_path: Optional path to soundfont file (.sf2)
+        """
+        if self._initialized or self._init_thread is not None:
+            return
+
+        self._init_done.clear()
+        self._init_thread = threading.Thread(
+            target=self._initialize_player_background,
+            args=(soundfont_path,),
+            daemon=True,
+            name="AudioInit"
+        )
+        self._init_thread.start()
+
+    def _initialize_player_background(self, soundfont_path: Optional[str]) -> None:
+        """Background thread body for initialize_player_async()."""
+        try:
+            self.initialize_player(soundfont_path)
+        finally:
+            self._init_done.set()
+
+    def _wait_for_background_init(self) -> None:
+        """Block until a pending background initialization has finished."""
+        if self._init_thread is not None:
+            self._init_done.wait()
+            self._init_thread = None
+
     def play_chord_immediate(self, chord_info: ChordInfo, current_key: Optional[str] = None) -> None:
         """Play a chord immediately (click-to-play) with dynamic note resolution.
 
@@ -157,19 +212,20 @@ class PlaybackService:
             # Resolve chord notes dynamically
             chord_notes = self._resolve_chord_notes(chord_info, current_key)
             if not chord_notes:
-                self._logger.warning(f"Could not resolve chord: {chord_info.chord}")
+                self._logger.warning("Could not resolve chord: %s", chord_info.chord)
                 return
 
             # Convert to MIDI
             midi_notes = self._notes_to_midi(chord_notes)
             if midi_notes:
-                self._logger.debug(f"Playing chord immediately: {chord_info.chord} -> {chord_notes.notes} (bass: {chord_notes.bass_note})")
+                self._logger.debug("Playing chord immediately: %s -> %s (bass: %s)",
+                                   chord_info.chord, chord_notes.notes, chord_notes.bass_note)
                 self._player.play_notes_immediate(midi_notes)
             else:
-                self._logger.warning(f"Could not convert chord to MIDI notes: {chord_info.chord}")
+                self._logger.warning("Could not convert chord to MIDI notes: %s", chord_info.chord)
 
         except Exception as e:
-            self._logger.error(f"Error playing chord: {e}", exc_info=True)
+            self._logger.error("Error playing chord: %s", e, exc_info=True)
 
     def play_notes_immediate(self, midi_notes: List[int]) -> None:
         """Play MIDI notes immediately.
@@ -182,13 +238,13 @@ class PlaybackService:
 
         try:
             if midi_notes:
-                self._logger.debug(f"Playing MIDI notes immediately: {midi_notes}")
+                self._logger.debug("Playing MIDI notes immediately: %s", midi_notes)
                 self._player.play_notes_immediate(midi_notes)
             else:
                 self._logger.warning("No MIDI notes provided to play")
 
         except Exception as e:
-            self._logger.error(f"Error playing notes: {e}", exc_info=True)
+            self._logger.error("Error playing notes: %s", e, exc_info=True)
 
     def play_note(self, note_name: str, octave: int, duration: float = 1.0) -> None:
         """Play a single note by name and octave.
@@ -207,17 +263,17 @@ class PlaybackService:
             NOTE_NAMES = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
 
             if note_name not in NOTE_NAMES:
-                self._logger.warning(f"Invalid note name: {note_name}")
+                self._logger.warning("Invalid note name: %s", note_name)
                 return
 
             note_offset = NOTE_NAMES.index(note_name)
             midi_note = (octave + 1) * 12 + note_offset
 
-            self._logger.debug(f"Playing note: {note_name}{octave} (MIDI {midi_note})")
+            self._logger.debug("Playing note: %s%d (MIDI %d)", note_name, octave, midi_note)
             self._player.play_notes_immediate([midi_note])
 
         except Exception as e:
-            self._logger.error(f"Error playing note {note_name}{octave}: {e}", exc_info=True)
+            self._logger.error("Error playing note %s%s: %s", note_name, octave, e, exc_info=True)
 
     def play_chord_from_midi(self, midi_notes: List[int], duration: float = 2.0) -> None:
         """Play a chord from MIDI note numbers.
@@ -275,8 +331,11 @@ class PlaybackService:
         Args:
             bpm: Beats per minute (60-240)
         """
+        if bpm == self._playback_state.bpm:
+            return
+
         if self._player:
-            self._logger.debug(f"Setting BPM to {bpm}")
+            self._logger.debug("Setting BPM to %s", bpm)
             self._player.set_bpm(bpm)
             self._config.set("bpm", bpm)
 
@@ -293,17 +352,22 @@ class PlaybackService:
                      40-47 = Strings
                      56-63 = Brass
         """
-        if self._player:
-            self._logger.debug(f"Setting instrument to program {program}")
+        if self._player and program != self._current_program:
+            self._logger.debug("Setting instrument to program %d", program)
+            # Keep the program's samples resident so switching back is instant
+            self._player.load_program(program)
             self._player.set_instrument(program)
+            self._current_program = program
 
     def cleanup(self) -> None:
         """Cleanup audio resources."""
+        self._wait_for_background_init()
         if self._player:
             self._logger.info("Cleaning up audio player")
             self._player.cleanup()
             self._player = None
             self._initialized = False
+            self._current_program = None
 
     def _ensure_initialized(self) -> bool:
         """Ensure player is initialized, initialize if needed.
@@ -311,9 +375,14 @@ class PlaybackService:
         Returns:
             True if initialized, False if initialization failed
         """
-        if not self._initialized:
-            return self.initialize_player()
-        return True
+        if self._initialized:
+            return True
+
+        if self._init_thread is not None:
+            self._wait_for_background_init()
+            return self._initialized
+
+        return self.initialize_player()
 
     @property
     def is_initialized(self) -> bool:
@@ -362,7 +431,10 @@ class PlaybackService:
             beats: Number of beats per measure
             unit: Beat unit (4 = quarter note, etc.)
         """
-        self._logger.debug(f"Setting time signature to {beats}/{unit}")
+        if (beats, unit) == self.get_time_signature():
+            return
+
+        self._logger.debug("Setting time signature to %s/%s", beats, unit)
         self._playback_state.set_time_signature(beats, unit)
 
         # Update player if initialized
@@ -377,7 +449,10 @@ class PlaybackService:
         Args:
             key: Key signature (e.g., 'C', 'Am', 'G')
         """
-        self._logger.debug(f"Setting key to {key}")
+        if key == self._playback_state.key:
+            return
+
+        self._logger.debug("Setting key to %s", key)
         self._playback_state.set_key(key)
 
     def get_playback_state(self) -> PlaybackState:
@@ -428,13 +503,13 @@ class PlaybackService:
         # Reset chord picker state for consistent voice leading at start of playback
         self._note_picker.reset()
 
-        # Count total chords
-        total_chords = sum(len(line.chords) for line in lines)
-        if total_chords == 0:
+        # The producer flattens and measures the song in a single pass; all
+        # that's needed here is whether there is anything to play
+        if not any(item.kind == ChordInfo.kind for line in lines for item in line.items):
             self._logger.info("No chords found for playback")
             return False
 
-        self._logger.info(f"Starting song playback with {total_chords} chords (producer-consumer)")
+        self._logger.info("Starting song playback (producer-consumer)")
 
         # Get initial playback parameters
         initial_bpm = self._playback_state.bpm
@@ -478,278 +553,6 @@ class PlaybackService:
         self._logger.info("Producer and consumer threads started")
         return True
 
-    def _build_label_index(self, playback_state: dict) -> None:
-        """Build an index of labels for loop jumps.
-
-        Args:
-            playback_state: Playback state dictionary
-        """
-        for line_idx, line in enumerate(playback_state['lines']):
-            for item_idx, item in enumerate(line.items):
-                if isinstance(item, Directive) and item.type == DirectiveType.LABEL:
-                    playback_state['labels'][item.label] = (line_idx, item_idx)
-                    self._logger.debug(f"Found label '{item.label}' at line {line_idx}, item {item_idx}")
-
-    def _get_next_playback_item(self, state: dict) -> Optional[Tuple[List[int], float]]:
-        """Get next playback item (processes directives, returns chord MIDI notes).
-
-        Args:
-            state: Playback state dictionary
-
-        Returns:
-            Tuple of (midi_notes, duration_in_beats) or None when done
-        """
-        while True:
-            # Check if we've reached the end
-            if state['line_index'] >= len(state['lines']):
-                return None
-
-            line = state['lines'][state['line_index']]
-
-            # Check if we've processed all items in this line
-            if state['item_index'] >= len(line.items):
-                state['line_index'] += 1
-                state['item_index'] = 0
-                continue
-
-            item = line.items[state['item_index']]
-            state['item_index'] += 1
-
-            # Process directives
-            if isinstance(item, Directive):
-                self._handle_directive(item, state)
-                continue
-
-            # Process chords
-            elif isinstance(item, ChordInfo):
-                result = self._play_chord_item(item, state)
-                if result:
-                    return result
-                # If result is None, chord couldn't be played, continue to next
-                continue
-
-        return None
-
-    def _handle_directive(self, directive: Directive, state: dict) -> None:
-        """Handle a directive during playback.
-
-        Args:
-            directive: Directive object
-            state: Playback state dictionary
-        """
-        # Skip invalid directives (they are kept for editor highlighting only)
-        if not directive.is_valid:
-            self._logger.debug(f"Skipping invalid directive at position {directive.start}")
-            return
-
-        if directive.type == DirectiveType.BPM:
-            self._handle_bpm_directive(directive)
-        elif directive.type == DirectiveType.KEY:
-            self._handle_key_directive(directive, state)
-        elif directive.type == DirectiveType.TIME_SIGNATURE:
-            self._handle_time_signature_directive(directive, state)
-        elif directive.type == DirectiveType.LOOP:
-            self._handle_loop_directive(directive, state)
-        elif directive.type == DirectiveType.LABEL:
-            self._handle_label_directive(directive, state)
-
-    def _handle_bpm_directive(self, directive: Directive) -> None:
-        """Handle BPM directive with support for multiple modifier types.
-
-        Args:
-            directive: Directive with BPM value
-        """
-        current_bpm = self._playback_state.bpm
-        new_bpm = current_bpm
-
-        if directive.bpm_modifier_type == BPMModifierType.ABSOLUTE:
-            # Absolute value: {bpm: 120}
-            new_bpm = directive.bpm
-            self._logger.debug(f"Directive: Setting BPM to {new_bpm}")
-
-        elif directive.bpm_modifier_type == BPMModifierType.RELATIVE:
-            # Relative adjustment: {bpm: +20} or {bpm: -20}
-            new_bpm = int(current_bpm + directive.bpm_modifier_value)
-            self._logger.debug(f"Directive: Adjusting BPM by {directive.bpm_modifier_value:+.0f} "
-                             f"({current_bpm} -> {new_bpm})")
-
-        elif directive.bpm_modifier_type == BPMModifierType.PERCENTAGE:
-            # Percentage: {bpm: 50%}
-            new_bpm = int(current_bpm * directive.bpm_modifier_value / 100)
-            self._logger.debug(f"Directive: Setting BPM to {directive.bpm_modifier_value}% "
-                             f"({current_bpm} -> {new_bpm})")
-
-        elif directive.bpm_modifier_type == BPMModifierType.MULTIPLIER:
-            # Multiplier: {bpm: 2x} or {bpm: 0.5x}
-            new_bpm = int(current_bpm * directive.bpm_modifier_value)
-            self._logger.debug(f"Directive: Multiplying BPM by {directive.bpm_modifier_value}x "
-                             f"({current_bpm} -> {new_bpm})")
-
-        elif directive.bpm_modifier_type == BPMModifierType.RESET:
-            # Reset to initial: {bpm: reset} or {bpm: original}
-            new_bpm = self._playback_state.initial_bpm
-            self._logger.debug(f"Directive: Resetting BPM to initial value "
-                             f"({current_bpm} -> {new_bpm})")
-
-        # Apply the new BPM value
-        self.set_bpm(new_bpm)
-
-    def _handle_key_directive(self, directive: Directive, state: dict) -> None:
-        """Handle key change directive.
-
-        Args:
-            directive: Directive with key value
-            state: Playback state dictionary
-        """
-        self._logger.debug(f"Directive: Setting key to {directive.key}")
-        state['current_key'] = directive.key
-
-    def _handle_time_signature_directive(self, directive: Directive, state: dict) -> None:
-        """Handle time signature directive.
-
-        Args:
-            directive: Directive with time signature
-            state: Playback state dictionary
-        """
-        self._logger.debug(f"Directive: Setting time signature to {directive.beats}/{directive.unit}")
-        state['current_time_sig'] = (directive.beats, directive.unit)
-
-    def _handle_loop_directive(self, directive: Directive, state: dict) -> None:
-        """Handle loop directive (restore state and jump to label).
-
-        Args:
-            directive: Directive with loop information
-            state: Playback state dictionary
-        """
-        if directive.label in state['labels']:
-            label_pos = state['labels'][directive.label]
-
-            # Check if we're already in a loop for this label
-            already_looping = any(loop['label'] == directive.label for loop in state['loop_stack'])
-
-            if not already_looping:
-                # First time hitting loop directive - initialize loop
-                self._logger.debug(f"Directive: Loop to label '{directive.label}' {directive.loop_count} times")
-
-                # Restore the saved state from the label before jumping back
-                if directive.label in state['label_states']:
-                    saved_state = state['label_states'][directive.label]
-                    self._logger.debug(f"Restoring state at loop: BPM={saved_state['bpm']}, "
-                                     f"time_sig={saved_state['time_sig']}, key={saved_state['key']}")
-                    self.set_bpm(saved_state['bpm'])
-                    state['current_time_sig'] = saved_state['time_sig']
-                    state['current_key'] = saved_state['key']
-
-                    # Restore chord picker state for consistent voice leading
-                    from audio.chord_picker import ChordPickerState
-                    self._note_picker.state = ChordPickerState.from_dict(saved_state['chord_picker_state'])
-
-                state['loop_stack'].append({
-                    'label': directive.label,
-                    'count': directive.loop_count,
-                    'remaining': directive.loop_count - 1,
-                    'target': label_pos
-                })
-                # Jump to label
-                state['line_index'], state['item_index'] = label_pos
-            # else: We're already looping, so we'll hit the label which handles continuation
-        else:
-            self._logger.warning(f"Label '{directive.label}' not found for loop")
-
-    def _handle_label_directive(self, directive: Directive, state: dict) -> None:
-        """Handle label directive (save state on first encounter, check loop completion).
-
-        Args:
-            directive: Directive with label
-            state: Playback state dictionary
-        """
-        # First time encountering this label - save the current playback state
-        if directive.label not in state['label_states']:
-            saved_state = {
-                'bpm': self._playback_state.bpm,
-                'time_sig': state['current_time_sig'],
-                'key': state['current_key'],
-                'chord_picker_state': self._note_picker.state.to_dict()
-            }
-            state['label_states'][directive.label] = saved_state
-            self._logger.debug(f"Saved state at label '{directive.label}': BPM={saved_state['bpm']}, "
-                             f"time_sig={saved_state['time_sig']}, key={saved_state['key']}")
-
-        # Check if we're in a loop and need to continue or finish
-        if state['loop_stack']:
-            current_loop = state['loop_stack'][-1]
-            # Check if this is the label we're looping on
-            if current_loop['label'] == directive.label:
-                if current_loop['remaining'] > 0:
-                    self._logger.debug(f"Continuing loop '{directive.label}' ({current_loop['remaining']} more times)")
-                    current_loop['remaining'] -= 1
-                    # Continue playing from after the label
-                else:
-                    # Loop finished
-                    self._logger.debug(f"Loop '{directive.label}' finished")
-                    state['loop_stack'].pop()
-
-    def _play_chord_item(self, chord: ChordInfo, state: dict) -> Optional[Tuple[List[int], float]]:
-        """Resolve and prepare a chord for playback.
-
-        Args:
-            chord: ChordInfo object
-            state: Playback state dictionary
-
-        Returns:
-            Tuple of (midi_notes, duration) or None if chord can't be played
-        """
-        if not chord.is_valid:
-            self._logger.warning(f"Skipping invalid chord: {chord.chord}")
-            return None
-
-        # Resolve chord to notes
-        chord_notes = self._resolve_chord_notes(chord, state['current_key'])
-        if not chord_notes:
-            self._logger.warning(f"Could not resolve chord: {chord.chord}")
-            return None
-
-        # Convert to MIDI
-        midi_notes = self._notes_to_midi(chord_notes)
-        if not midi_notes:
-            self._logger.warning(f"Could not convert chord to MIDI: {chord.chord}")
-            return None
-
-        # Determine duration
-        if chord.duration is not None:
-            duration = float(chord.duration)
-        else:
-            # Default to full measure
-            duration = float(state['current_time_sig'][0])
-
-        # Calculate current bar number based on beat position
-        time_sig_beats = state['current_time_sig'][0]
-        current_bar = int(state['current_beat_position'] / time_sig_beats) + 1
-
-        # Fire playback event callback if provided
-        if state.get('on_event_callback'):
-            try:
-                event_args = PlaybackEventArgs(
-                    event_type=PlaybackEventType.CHORD_START,
-                    chord_info=chord,
-                    bpm=self._playback_state.bpm,
-                    time_signature_beats=state['current_time_sig'][0],
-                    time_signature_unit=state['current_time_sig'][1],
-                    key=state['current_key'],
-                    current_line=state['line_index'],
-                    current_bar=current_bar,
-                    total_bars=state['total_bars']
-                )
-                state['on_event_callback'](event_args)
-            except Exception as e:
-                self._logger.error(f"Error in playback event callback: {e}", exc_info=True)
-
-        # Update beat position for next chord
-        state['current_beat_position'] += duration
-
-        self._logger.debug(f"Playing chord: {chord.chord} -> {chord_notes.notes} (bass: {chord_notes.bass_note}, duration={duration})")
-        return (midi_notes, duration)
-
     def _resolve_chord_notes(self, chord: ChordInfo, current_key: Optional[str]) -> Optional[ChordNotes]:
         """Resolve a chord to its note names based on current key.
 
@@ -760,18 +563,28 @@ class PlaybackService:
         Returns:
             ChordNotes object with notes, bass_note, and root, or None if resolution fails
         """
-        from chord.helper import ChordHelper
-
-        helper = ChordHelper()
         # Only pass key for relative (roman numeral) chords
         # Absolute chords should ignore the key parameter
         key_to_use = current_key if chord.is_relative else None
-        chord_notes_result = helper.compute_chord_notes(
+        cache_key = (chord.chord, key_to_use, chord.is_relative)
+        try:
+            return self._resolve_cache[cache_key]
+        except KeyError:
+            pass
+
+        if self._chord_helper is None:
+            from chord.helper import ChordHelper
+            self._chord_helper = ChordHelper()
+
+        chord_notes_result = self._chord_helper.compute_chord_notes(
             chord.chord,
             key=key_to_use,
             is_relative=chord.is_relative
         )
 
+        if len(self._resolve_cache) >= _RESOLVE_CACHE_SIZE:
+            self._resolve_cache.clear()
+        self._resolve_cache[cache_key] = chord_notes_result
         return chord_notes_result
 
     def _notes_to_midi(self, chord_notes: ChordNotes) -> Optional[List[int]]:
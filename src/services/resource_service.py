@@ -3,6 +3,7 @@
 import sys
 import os
 from pathlib import Path
+from typing import Dict
 
 
 class ResourceService:
@@ -14,6 +15,9 @@ class ResourceService:
 
     def __init__(self):
         self._base_path: Path = self._determine_base_path()
+        # The base path is fixed for the process, so resolved paths never go stale
+        self._base_str: str = os.fspath(self._base_path)
+        self._resolved_paths: Dict[str, str] = {}
 
     def _determine_base_path(self) -> Path:
         """Determine the base path for resources.
@@ -42,7 +46,10 @@ class ResourceService:
         Returns:
             Absolute path to the resource as a string
         """
-        return os.path.join(self._base_path, relative_path)
+        path = self._resolved_paths.get(relative_path)
+        if path is None:
+            path = self._resolved_paths[relative_path] = os.path.join(self._base_str, relative_path)
+        return path
 
     def get_base_path(self) -> Path:
         """Get the base path for resources.
@@ -2,12 +2,16 @@
 
 import logging
 import re
-from typing import List, Union, Optional
+from bisect import bisect_right
+from collections import defaultdict
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, Union, Optional
 
 from chord.detector import ChordDetector
 from chord.helper import ChordHelper
 from chord.converter import NotationConverter
-from models.line import Line
+from models.line import Line, LineType
 from models.chord import ChordInfo
 from models.directive import Directive, DirectiveType, BPMModifierType
 from models.song import Song
@@ -15,6 +19,11 @@ from models.label import Label
 from models.notation import Notation
 
 
+def _blank_match(match: re.Match) -> str:
+    """Replace a regex match with the same number of spaces."""
+    return ' ' * (match.end() - match.start())
+
+
 class SongParserService:
     """Manages song parsing operations.
 
@@ -25,11 +34,31 @@ class SongParserService:
     # Comment pattern - matches // and everything after it
     COMMENT_PATTERN = re.compile(r'//.*$', re.MULTILINE)
 
+    # Directive pattern - matches {keyword: value}
+    DIRECTIVE_PATTERN = re.compile(r'\{([^:}]+):\s*([^}]+)\}')
+
+    # Roman numeral chord patterns: leading accidental, quality markers and
+    # extensions (including 'o' for diminished), and the bare numeral
+    ACCIDENTAL_PATTERN = re.compile(r'^[#b♭♯]')
+    QUALITY_PATTERN = re.compile(r'[o°+Δ∆]|[Mm]?[79]|sus[24]|add[0-9]|maj|min|dim|aug')
+    ROMAN_PATTERN = re.compile(r'^[IViv]+$')
+
+    # Maximum entries in each chord lookup cache
+    CHORD_CACHE_SIZE = 4096
+
     def __init__(self):
         self._helper = ChordHelper()
         self._converter = NotationConverter()
         self._logger = logging.getLogger(__name__)
 
+        # Chord detectors are stateless between calls, so keep one per notation
+        self._detectors: Dict[str, ChordDetector] = {}
+
+        # Per-instance memo caches for the pure chord lookups (keyed by american chord text)
+        self._validate_cached = lru_cache(maxsize=self.CHORD_CACHE_SIZE)(self._helper.is_valid_chord)
+        self._notes_cached = lru_cache(maxsize=self.CHORD_CACHE_SIZE)(self._get_notes_impl)
+        self._midi_cached = lru_cache(maxsize=self.CHORD_CACHE_SIZE)(self._chord_to_midi_impl)
+
     def parse_directives(self, text: str) -> List[Directive]:
         """Parse directives from text.
 
@@ -40,7 +69,8 @@ class SongParserService:
         - {key: C}
         - {loop: label count}
 
-        Comments (// to end of line) are stripped before parsing.
+        Comments (// to end of line) are blanked out before parsing, so
+        directive positions still index into the original text.
 
         Args:
             text: Text to parse
@@ -50,13 +80,10 @@ class SongParserService:
         """
         directives = []
 
-        # Strip comments before parsing directives
-        text = self.COMMENT_PATTERN.sub('', text)
-
-        # Pattern to match {keyword: value}
-        pattern = r'\{([^:}]+):\s*([^}]+)\}'
+        # Blank out comments before parsing directives (keeping positions intact)
+        text = self.COMMENT_PATTERN.sub(_blank_match, text)
 
-        for match in re.finditer(pattern, text):
+        for match in self.DIRECTIVE_PATTERN.finditer(text):
             start = match.start()
             end = match.end()
             keyword = match.group(1).strip().lower()
@@ -133,7 +160,7 @@ class SongParserService:
                     raise ValueError(f"Unknown directive keyword: {keyword}")
 
             except (ValueError, IndexError) as e:
-                self._logger.warning(f"Failed to parse directive at position {start}: {e}")
+                self._logger.warning("Failed to parse directive at position %d: %s", start, e)
                 # Create an invalid directive
                 if not directive_created:
                     directive = Directive(
@@ -187,7 +214,7 @@ class SongParserService:
                     bpm_modifier_value=percentage
                 )
             except ValueError:
-                self._logger.warning(f"Invalid percentage BPM value: {value}")
+                self._logger.warning("Invalid percentage BPM value: %s", value)
                 return Directive(
                     type=DirectiveType.BPM,
                     start=start,
@@ -207,7 +234,7 @@ class SongParserService:
                     bpm_modifier_value=multiplier
                 )
             except ValueError:
-                self._logger.warning(f"Invalid multiplier BPM value: {value}")
+                self._logger.warning("Invalid multiplier BPM value: %s", value)
                 return Directive(
                     type=DirectiveType.BPM,
                     start=start,
@@ -227,7 +254,7 @@ class SongParserService:
                     bpm_modifier_value=float(relative_value)
                 )
             except ValueError:
-                self._logger.warning(f"Invalid relative BPM value: {value}")
+                self._logger.warning("Invalid relative BPM value: %s", value)
                 return Directive(
                     type=DirectiveType.BPM,
                     start=start,
@@ -246,7 +273,7 @@ class SongParserService:
                 bpm_modifier_type=BPMModifierType.ABSOLUTE
             )
         except ValueError:
-            self._logger.warning(f"Invalid BPM value: {value}")
+            self._logger.warning("Invalid BPM value: %s", value)
             return Directive(
                 type=DirectiveType.BPM,
                 start=start,
@@ -266,13 +293,12 @@ class SongParserService:
         # Remove quality markers and extensions to get the base
         base = chord_str.split('/')[0]  # Handle slash chords
         # Remove accidentals from the beginning
-        base = re.sub(r'^[#b♭♯]', '', base)
+        base = self.ACCIDENTAL_PATTERN.sub('', base)
         # Remove quality markers (including 'o' for diminished)
-        base = re.sub(r'[o°+Δ∆]|[Mm]?[79]|sus[24]|add[0-9]|maj|min|dim|aug', '', base)
+        base = self.QUALITY_PATTERN.sub('', base)
 
         # Check if base matches roman numeral pattern
-        roman_pattern = r'^[IViv]+$'
-        return bool(re.match(roman_pattern, base.strip()))
+        return bool(self.ROMAN_PATTERN.match(base.strip()))
 
     def parse_chord_with_duration(self, chord_str: str) -> tuple[str, Optional[float]]:
         """Parse a chord string that may include duration.
@@ -294,6 +320,20 @@ class SongParserService:
                 pass
         return (chord_str, None)
 
+    def _get_detector(self, notation: str) -> ChordDetector:
+        """Get the shared ChordDetector for a notation, creating it on first use.
+
+        Args:
+            notation: Notation system ("american" or "european")
+
+        Returns:
+            ChordDetector instance for the notation
+        """
+        detector = self._detectors.get(notation)
+        if detector is None:
+            detector = self._detectors[notation] = ChordDetector(notation=notation)
+        return detector
+
     def detect_chords_in_text(self, text: str, notation: Union[Notation, str] = "american") -> List[Line]:
         """Detect chords in a block of text.
 
@@ -304,20 +344,25 @@ class SongParserService:
         Returns:
             List of Line objects with detected chords
         """
+        # Blank text (common while typing) can't contain chords or directives
+        if not text or text.isspace():
+            return [Line.from_trusted(content, line_num, LineType.TEXT)
+                    for line_num, content in enumerate(text.split('\n'), start=1)]
+
         # Convert Notation enum to string if needed
         notation_str = notation.value if isinstance(notation, Notation) else notation
-        self._logger.debug(f"Detecting chords in text using {notation_str} notation")
+        self._logger.debug("Detecting chords in text using %s notation", notation_str)
 
-        # Create detector with the specified notation
-        detector = ChordDetector(notation=notation_str)
+        # Get the pooled detector for the specified notation
+        detector = self._get_detector(notation_str)
 
         # Get chord detections
         chord_infos = detector.detect_chords_in_text(text)
-        self._logger.debug(f"Detected {len(chord_infos)} chords")
+        self._logger.debug("Detected %d chords", len(chord_infos))
 
         # Convert to Line objects
         lines = self._convert_chord_infos_to_lines(text, chord_infos)
-        self._logger.debug(f"Created {len(lines)} Line objects")
+        self._logger.debug("Created %d Line objects", len(lines))
 
         return lines
 
@@ -335,8 +380,8 @@ class SongParserService:
         # Convert Notation enum to string if needed
         notation_str = notation.value if isinstance(notation, Notation) else notation
 
-        # Create detector with the specified notation
-        detector = ChordDetector(notation=notation_str)
+        # Get the pooled detector for the specified notation
+        detector = self._get_detector(notation_str)
 
         # Get chord detections for this line
         chord_infos = detector.detect_chords_in_text(line_text)
@@ -364,57 +409,37 @@ class SongParserService:
             List of Line objects
         """
         lines = []
-        text_lines = text.split('\n')
 
         # Group chords by line number
-        chords_by_line = {}
+        chords_by_line = defaultdict(list)
         for chord_info in chord_infos:
-            line_num = chord_info.line
-            if line_num not in chords_by_line:
-                chords_by_line[line_num] = []
-            chords_by_line[line_num].append(chord_info)
-
-        # Parse all directives from text
-        all_directives = self.parse_directives(text)
+            chords_by_line[chord_info.line].append(chord_info)
 
-        # Group directives by line number
-        directives_by_line = {}
-        char_offset = 0
-        for line_num, content in enumerate(text_lines, start=1):
-            # Find directives that fall within this line's character range
-            line_start = char_offset
-            line_end = char_offset + len(content)
-
-            for directive in all_directives:
-                if line_start <= directive.start < line_end:
-                    if line_num not in directives_by_line:
-                        directives_by_line[line_num] = []
-                    directives_by_line[line_num].append(directive)
+        # split('\n') is kept (not splitlines()) so line numbers and character
+        # offsets match the detector
+        text_lines = text.split('\n')
 
-            char_offset += len(content) + 1  # +1 for newline
+        # Group directives by line, binary searching each start in the line start offsets
+        line_starts = list(accumulate((len(content) + 1 for content in text_lines[:-1]), initial=0))
+        directives_by_line = defaultdict(list)
+        for directive in self.parse_directives(text):
+            directives_by_line[bisect_right(line_starts, directive.start)].append(directive)
 
-        # Create Line objects for each text line
+        # Create Line objects in a single pass over the text lines
         for line_num, content in enumerate(text_lines, start=1):
-            line = Line(content=content, line_number=line_num)
-
-            # Collect chords and directives for this line
-            chords = chords_by_line.get(line_num, [])
+            # Collect chords and directives for this line (get() doesn't insert into the defaultdict)
+            chords = chords_by_line.get(line_num)
             directives = directives_by_line.get(line_num, [])
 
             if chords:
                 # This is a chord line - combine chords and directives
-                items = chords + directives
+                items = chords + directives if directives else chords[:]
                 # Sort by position
                 items.sort(key=lambda item: item.start)
-                line.set_as_chord_line(chords)
-                line.items = items  # Override to include directives
-            elif directives:
-                # Line has only directives - still a text line, but with directive items
-                line.set_as_text_line()
-                line.items = directives
+                line = Line.from_trusted(content, line_num, LineType.CHORD, items)
             else:
-                # Pure text line
-                line.set_as_text_line()
+                # Text line, possibly carrying directive items
+                line = Line.from_trusted(content, line_num, LineType.TEXT, directives)
 
             lines.append(line)
 
@@ -434,7 +459,7 @@ class SongParserService:
         if notation == "european":
             chord_text = self._converter.european_to_american(chord_text)
 
-        return self._helper.is_valid_chord(chord_text)
+        return self._validate_cached(chord_text)
 
     def get_chord_notes(self, chord_text: str, notation: str = "american") -> List[str]:
         """Get the note names that make up a chord.
@@ -450,8 +475,12 @@ class SongParserService:
         if notation == "european":
             chord_text = self._converter.european_to_american(chord_text)
 
+        return list(self._notes_cached(chord_text))
+
+    def _get_notes_impl(self, chord_text: str) -> tuple:
+        """Uncached note lookup; returns a tuple so cached results stay immutable."""
         notes = self._helper.get_notes(chord_text)
-        return notes if notes else []
+        return tuple(notes) if notes else ()
 
     def convert_to_american(self, text: str) -> str:
         """Convert text from European to American notation.
@@ -498,8 +527,12 @@ class SongParserService:
         Returns:
             List of MIDI note numbers
         """
+        return list(self._midi_cached(chord_name, base_octave))
+
+    def _chord_to_midi_impl(self, chord_name: str, base_octave: int) -> tuple:
+        """Uncached MIDI conversion; returns a tuple so cached results stay immutable."""
         midi_notes = self._helper.chord_to_midi(chord_name, base_octave)
-        return midi_notes if midi_notes else []
+        return tuple(midi_notes) if midi_notes else ()
 
     def build_song(self, text: str, notation: Union[Notation, str] = "american") -> Song:
         """Build a complete Song object from text.
@@ -517,37 +550,28 @@ class SongParserService:
         # Parse lines with chords and directives
         lines = self.detect_chords_in_text(text, notation)
 
-        # Extract labels from LABEL directives
+        # Extract labels from the LABEL directives already attached to the lines,
+        # rather than parsing every line's directives a second time
         labels = {}
         char_offset = 0
-        text_lines = text.split('\n')
 
-        for line_num, line_content in enumerate(text_lines, start=1):
-            # Find label directives in this line
+        for line in lines:
             line_start = char_offset
-            line_end = char_offset + len(line_content)
+            char_offset += len(line.content) + 1  # +1 for newline
 
-            # Parse directives for this line
-            line_directives = self.parse_directives(line_content)
-
-            for directive in line_directives:
+            for directive in line.directives:
                 if directive.type == DirectiveType.LABEL:
-                    # Calculate offset within the line
-                    offset = directive.start
-
-                    # Create Label object
+                    # Directive positions are in the full text; labels store the offset within the line
                     label = Label(
                         name=directive.label,
-                        line_number=line_num,
-                        offset=offset
+                        line_number=line.line_number,
+                        offset=directive.start - line_start
                     )
                     labels[directive.label] = label
-                    self._logger.debug(f"Found label '{directive.label}' at line {line_num}")
-
-            char_offset += len(line_content) + 1  # +1 for newline
+                    self._logger.debug("Found label '%s' at line %d", directive.label, line.line_number)
 
         # Build Song object
         song = Song(lines=lines, labels=labels)
-        self._logger.info(f"Built song with {song.line_count()} lines and {len(labels)} labels")
+        self._logger.info("Built song with %d lines and %d labels", song.line_count(), len(labels))
 
         return song
@@ -5,7 +5,6 @@ Chord identification window with piano roll and note input
 import logging
 import tkinter as tk
 from tkinter import ttk
-import re
 
 logger = logging.getLogger(__name__)
 
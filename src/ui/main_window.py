@@ -7,7 +7,7 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, font as tkfont
 import os
 from pathlib import Path
-from typing import Any, Optional, List
+from typing import Any, Optional
 from PIL import Image, ImageTk
 from ui.text_editor import ChordTextEditor
 from ui.chord_identifier import ChordIdentifierWindow
@@ -300,7 +300,7 @@ class MainWindow(tk.Tk):
 
         # File menu
         # Create recent files submenu first
-        self.recent_menu = tk.Menu(menubar, tearoff=0)
+        self.recent_menu = tk.Menu(menubar, tearoff=0, postcommand=self._on_recent_menu_post)
         self.update_recent_files_menu()
 
         file_menu = MenuBuilder(menubar) \
@@ -370,7 +370,8 @@ class MainWindow(tk.Tk):
 
         # Create instrument submenu with categories
         self.instrument_var = tk.IntVar(value=self.viewmodel.get_instrument())
-        self.instrument_menu = tk.Menu(menubar, tearoff=0)
+        self.instrument_menu = tk.Menu(menubar, tearoff=0,
+                                       postcommand=self._on_instrument_menu_post)
         self.build_instrument_menu()
 
         playback_menu = tk.Menu(menubar, tearoff=0)
@@ -757,6 +758,11 @@ class MainWindow(tk.Tk):
         # Rebuild the menu to update the indicator
         self.build_instrument_menu()
 
+    def _on_instrument_menu_post(self) -> None:
+        """Fill the instrument menu once the audio player has finished loading"""
+        if not self._instrument_menu_populated:
+            self.build_instrument_menu()
+
     def build_instrument_menu(self) -> None:
         """Build or rebuild the instrument menu with category indicators"""
         # Clear existing menu items
@@ -764,6 +770,7 @@ class MainWindow(tk.Tk):
 
         # Get available instruments from soundfont
         instruments = self.viewmodel.get_available_instruments()
+        self._instrument_menu_populated = bool(instruments)
         current_instrument = self.viewmodel.get_instrument()
 
         # Group instruments by General MIDI families (8 instruments per family)
@@ -806,10 +813,14 @@ class MainWindow(tk.Tk):
 
             self.instrument_menu.add_cascade(label=label, menu=category_menu)
 
-    def update_recent_files_menu(self) -> None:
+    def _on_recent_menu_post(self) -> None:
+        """Drop recent files that no longer exist right before the menu opens"""
+        self.update_recent_files_menu(refresh=True)
+
+    def update_recent_files_menu(self, refresh: bool = False) -> None:
         """Update recent files menu"""
         self.recent_menu.delete(0, tk.END)
-        recent_files = self.viewmodel.get_recent_files()
+        recent_files = self.viewmodel.get_recent_files(force_refresh=refresh)
         if not recent_files:
             self.recent_menu.add_command(label="(No recent files)", state=tk.DISABLED)
         else:
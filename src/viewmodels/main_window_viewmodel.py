@@ -588,13 +588,16 @@ class MainWindowViewModel(Observable):
         """Decrease font size by 1."""
         self.set_font_size(max(self._font_size - 1, 6))
 
-    def get_recent_files(self) -> List[Path]:
+    def get_recent_files(self, force_refresh: bool = False) -> List[Path]:
         """Get list of recently opened files.
 
+        Args:
+            force_refresh: Re-check that each file still exists
+
         Returns:
             List of file paths
         """
-        return self._file.get_recent_files()
+        return self._file.get_recent_files(force_refresh=force_refresh)
 
     def reset_font_size(self) -> None:
         """Reset font size to default."""
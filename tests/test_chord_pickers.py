@@ -206,6 +206,22 @@ class TestChordPickerBasics:
         assert getattr(state, 'previous_fingering', None) is None
         assert state.previous_chord_notes is None
 
+    def test_state_restore_replays_voicing(self, picker):
+        """Test restoring a saved state reproduces the same voicing"""
+        picker.chord_to_midi(ChordNotes(notes=['C', 'E', 'G'], bass_note='C', root='C'))
+        saved = picker.state
+
+        next_chord = ChordNotes(notes=['F', 'A', 'C'], bass_note='F', root='F')
+        first = picker.chord_to_midi(next_chord)
+        picker.chord_to_midi(ChordNotes(notes=['B', 'D', 'F'], bass_note='B', root='B'))
+
+        picker.state = saved
+        assert picker.chord_to_midi(next_chord) == first
+
+        # Playing after the restore must not have changed the saved snapshot
+        picker.state = saved
+        assert picker.chord_to_midi(next_chord) == first
+
 
 # Property-based fuzzing tests
 class TestChordPickerFuzzing:
@@ -0,0 +1,160 @@
+"""Tests for ConfigService persistence and change notifications."""
+import json
+from unittest.mock import Mock
+
+import pytest
+
+import services.config_service as config_module
+from exceptions import ConfigurationError
+from services.config_service import ConfigService
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson (if installed) and with the stdlib fallback."""
+    if request.param == "json":
+        monkeypatch.setattr(config_module, "orjson", None)
+    elif config_module.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    """Path of the settings file inside a temp directory."""
+    return tmp_path / "settings.json"
+
+
+@pytest.fixture
+def config_service(config_path):
+    """Create a ConfigService storing its settings in a temp directory."""
+    appdata = Mock()
+    appdata.get_config_file_path.return_value = config_path
+    return ConfigService(appdata)
+
+
+class TestConfigPersistence:
+    """Test loading and saving the settings file."""
+
+    def test_defaults_saved_when_no_file(self, config_service, config_path, json_backend):
+        """Test a missing settings file is created with default values."""
+        config = config_service.load_config()
+
+        assert json.loads(config_path.read_text(encoding='utf-8')) == config.to_dict()
+
+    def test_round_trip(self, config_service, config_path, json_backend):
+        """Test saved values, including non-ASCII text, load back unchanged."""
+        config_service.set("font_family", "Fira Sans ♯")
+        config_service.set("bpm", 140)
+        config_service.save_config()
+
+        appdata = Mock()
+        appdata.get_config_file_path.return_value = config_path
+        reloaded = ConfigService(appdata)
+
+        assert reloaded.get("font_family") == "Fira Sans ♯"
+        assert reloaded.get("bpm") == 140
+        assert "Fira Sans ♯" in config_path.read_text(encoding='utf-8')
+
+    def test_corrupted_file_raises(self, config_service, config_path, json_backend):
+        """Test invalid JSON is reported as a configuration error."""
+        config_path.write_text("{not json", encoding='utf-8')
+
+        with pytest.raises(ConfigurationError):
+            config_service.load_config()
+
+    def test_unchanged_save_skipped(self, config_service, monkeypatch):
+        """Test saving without changes since the last write doesn't touch the file."""
+        config_service.load_config()
+        writes = []
+        monkeypatch.setattr(config_module, "_write_json", lambda path, data: writes.append(data))
+
+        config_service.save_config()
+        assert writes == []
+
+        config_service.set("bpm", 90)
+        config_service.save_config()
+        config_service.save_config()
+        assert len(writes) == 1
+
+    def test_in_place_edit_saved(self, config_service, monkeypatch):
+        """Test a list setting edited in place counts as a change."""
+        config_service.load_config()
+        writes = []
+        monkeypatch.setattr(config_module, "_write_json", lambda path, data: writes.append(data))
+
+        config_service.get("recent_files").append("/tmp/song.txt")
+        config_service.save_config()
+
+        assert len(writes) == 1
+        assert writes[0]["recent_files"] == ["/tmp/song.txt"]
+
+    def test_atomic_write_leaves_no_temp_file(self, config_service, config_path):
+        """Test a successful save replaces the file and removes the temp file."""
+        config_service.load_config()
+        config_service.set("bpm", 100)
+        config_service.save_config()
+
+        assert json.loads(config_path.read_text(encoding='utf-8'))["bpm"] == 100
+        assert list(config_path.parent.iterdir()) == [config_path]
+
+    def test_failed_write_keeps_old_file(self, config_service, config_path, monkeypatch):
+        """Test an interrupted save keeps the previous file and cleans up."""
+        config_service.load_config()
+        original = config_path.read_text(encoding='utf-8')
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(config_module.os, "replace", fail_replace)
+        config_service.set("bpm", 100)
+        with pytest.raises(ConfigurationError):
+            config_service.save_config()
+
+        assert config_path.read_text(encoding='utf-8') == original
+        assert list(config_path.parent.iterdir()) == [config_path]
+
+
+class TestConfigNotifications:
+    """Test observers are told about setting changes."""
+
+    def test_set_notifies_observers(self, config_service):
+        """Test set() passes the new value to observers of that key."""
+        seen = []
+        config_service.observe("bpm", seen.append)
+
+        config_service.set("bpm", 150)
+        config_service.set("font_size", 14)
+
+        assert seen == [150]
+
+    def test_in_place_edit_written_back_notifies(self, config_service):
+        """Test writing back a list edited in place still notifies observers."""
+        seen = []
+        config_service.observe("recent_files", seen.append)
+
+        recent = config_service.get("recent_files")
+        recent.append("/tmp/song.txt")
+        config_service.set("recent_files", recent)
+
+        assert seen == [["/tmp/song.txt"]]
+
+    def test_unknown_key_rejected(self, config_service):
+        """Test setting a key that doesn't exist raises and notifies nobody."""
+        seen = []
+        config_service.observe("no_such_key", seen.append)
+
+        with pytest.raises(ConfigurationError):
+            config_service.set("no_such_key", 1)
+        assert seen == []
+
+    def test_reset_notifies_observers(self, config_service):
+        """Test resetting to defaults notifies observers with the default values."""
+        seen = []
+        config_service.set("bpm", 150)
+        config_service.observe("bpm", seen.append)
+
+        config_service.reset_to_defaults()
+
+        assert seen == [config_service.get("bpm")]
+        assert seen[0] != 150
@@ -85,6 +85,29 @@ class TestEventBufferBasics:
             assert popped.timestamp == expected_event.timestamp
             assert popped.midi_notes == expected_event.midi_notes
 
+    def test_push_events_batch(self, event_buffer):
+        """Test pushing several events at once keeps their order."""
+        events = [
+            MidiEvent(timestamp=0.0, event_type=MidiEventType.NOTE_ON, midi_notes=[60]),
+            MidiEvent(timestamp=1.0, event_type=MidiEventType.NOTE_OFF, midi_notes=[60]),
+        ]
+        assert event_buffer.push_events(events) is True
+        assert event_buffer.size() == 2
+        assert event_buffer.pop_event() is events[0]
+        assert event_buffer.pop_event() is events[1]
+
+    def test_push_events_waits_for_room_for_whole_batch(self, event_buffer):
+        """Test a batch is not split when only part of it fits."""
+        for i in range(9):
+            event_buffer.push_event(MidiEvent(timestamp=float(i), event_type=MidiEventType.NOTE_ON))
+
+        pair = [
+            MidiEvent(timestamp=9.0, event_type=MidiEventType.NOTE_ON),
+            MidiEvent(timestamp=10.0, event_type=MidiEventType.NOTE_OFF),
+        ]
+        assert event_buffer.push_events(pair, timeout=0.1) is False
+        assert event_buffer.size() == 9
+
     def test_clear_buffer(self, event_buffer):
         """Test clearing the buffer."""
         # Add some events
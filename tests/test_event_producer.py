@@ -4,7 +4,7 @@ import time
 from unittest.mock import Mock, MagicMock
 from typing import List
 
-from services.event_producer import EventProducer
+from services.event_producer import EventProducer, ProductionState
 from audio.event_buffer import EventBuffer
 from audio.chord_picker import ChordNotePicker
 from models.line import Line
@@ -245,6 +245,79 @@ class TestEventProducerDirectives:
         note_on_events = [e for e in events if e.event_type == MidiEventType.NOTE_ON]
         assert len(note_on_events) == 2, "Should have events for both chords"
 
+    def test_overridden_directives_coalesced(self, event_buffer, note_picker, mock_application):
+        """Test directives overridden before the next chord are folded into the last one."""
+        def bpm_directive(modifier_type, value=None):
+            directive = Directive(type=DirectiveType.BPM, start=0, end=1, is_valid=True)
+            directive.bpm_modifier_type = modifier_type
+            directive.bpm = value
+            directive.bpm_modifier_value = value
+            return directive
+
+        bpm_absolute = bpm_directive(BPMModifierType.ABSOLUTE, 140)
+        key_c = Directive(type=DirectiveType.KEY, start=0, end=1, is_valid=True)
+        key_c.key = "C"
+        key_g = Directive(type=DirectiveType.KEY, start=0, end=1, is_valid=True)
+        key_g.key = "G"
+        bpm_reset = bpm_directive(BPMModifierType.RESET)
+        bpm_half = bpm_directive(BPMModifierType.PERCENTAGE, 50)
+        bpm_double = bpm_directive(BPMModifierType.MULTIPLIER, 2)
+        chord = ChordInfo(chord="C", start=0, end=1, is_relative=False, is_valid=True)
+        key_d = Directive(type=DirectiveType.KEY, start=0, end=1, is_valid=True)
+        key_d.key = "D"
+        line = Line(content="", line_number=1)
+        line.items = [bpm_absolute, key_c, key_g, bpm_reset, bpm_half, chord, key_d]
+
+        producer = EventProducer(
+            lines=[line],
+            initial_key="C",
+            initial_bpm=120,
+            initial_time_sig=(4, 4),
+            note_picker=note_picker,
+            event_buffer=event_buffer,
+            application=mock_application
+        )
+        state = ProductionState()
+        producer._flatten(state)
+
+        # The reset replaces the absolute BPM; the relative change after it is kept
+        assert state.items == [bpm_reset, key_g, bpm_half, chord, key_d]
+        assert len(state.kinds) == len(state.item_lines) == len(state.durations) == 5
+
+        line.items = [bpm_absolute, bpm_half, bpm_double, chord]
+        state = ProductionState()
+        producer._flatten(state)
+
+        # Relative changes depend on the previous BPM, so none are dropped
+        assert state.items == [bpm_absolute, bpm_half, bpm_double, chord]
+
+    def test_bar_numbers_exact_for_fractional_durations(self, event_buffer, note_picker, mock_application):
+        """Test fractional durations adding up to a full bar advance the bar number."""
+        line = Line(content="", line_number=1)
+        line.items = [
+            ChordInfo(chord="NC", start=i, end=i + 1, is_valid=True, is_rest=True, duration=0.1)
+            for i in range(10)
+        ]
+        line.items.append(ChordInfo(chord="NC", start=10, end=11, is_valid=True, is_rest=True))
+
+        producer = EventProducer(
+            lines=[line],
+            initial_key="C",
+            initial_bpm=120,
+            initial_time_sig=(1, 4),
+            note_picker=note_picker,
+            event_buffer=event_buffer,
+            application=mock_application
+        )
+        state = ProductionState(current_time_sig=(1, 4))
+        producer._flatten(state)
+
+        bars = []
+        while (events := producer._get_next_events(state)) is not None:
+            bars.append(events[0].metadata['bar'])
+
+        assert bars == [1] * 10 + [2]
+
 
 class TestEventProducerNoteOnOff:
     """Test NOTE_ON and NOTE_OFF event generation."""
@@ -380,3 +453,80 @@ class TestEventProducerEdgeCases:
         # Should only have events for 2 valid chords
         note_on_events = [e for e in events if e.event_type == MidiEventType.NOTE_ON]
         assert len(note_on_events) == 2, "Should only have events for valid chords"
+
+    def test_repeated_chords_resolved_once(self, event_buffer, note_picker, mock_application):
+        """Test that repeated chords reuse the cached note resolution."""
+        line = Line(content="C C C", line_number=1)
+        line.items = [
+            ChordInfo(chord="C", start=i * 2, end=i * 2 + 1, is_relative=False, is_valid=True)
+            for i in range(3)
+        ]
+
+        producer = EventProducer(
+            lines=[line],
+            initial_key="C",
+            initial_bpm=120,
+            initial_time_sig=(4, 4),
+            note_picker=note_picker,
+            event_buffer=event_buffer,
+            application=mock_application
+        )
+        producer._chord_helper = Mock(wraps=producer._chord_helper)
+
+        producer.start()
+        time.sleep(0.2)
+
+        events = []
+        while True:
+            event = event_buffer.pop_event(timeout=0.1)
+            if event is None or event.event_type == MidiEventType.END_OF_SONG:
+                break
+            events.append(event)
+
+        producer.stop()
+
+        note_on_events = [e for e in events if e.event_type == MidiEventType.NOTE_ON]
+        assert len(note_on_events) == 3
+        assert producer._chord_helper.compute_chord_notes.call_count == 1
+
+    def test_start_position_skips_earlier_chords(self, event_buffer, note_picker, mock_application):
+        """Test that playback starts at the given line and item."""
+        line1 = Line(content="C G", line_number=1)
+        line1.items = [
+            ChordInfo(chord="C", start=0, end=1, is_relative=False, is_valid=True),
+            ChordInfo(chord="G", start=2, end=3, is_relative=False, is_valid=True),
+        ]
+        line2 = Line(content="Am F", line_number=2)
+        line2.items = [
+            ChordInfo(chord="Am", start=4, end=6, is_relative=False, is_valid=True),
+            ChordInfo(chord="F", start=7, end=8, is_relative=False, is_valid=True),
+        ]
+
+        producer = EventProducer(
+            lines=[line1, line2],
+            initial_key="C",
+            initial_bpm=120,
+            initial_time_sig=(4, 4),
+            note_picker=note_picker,
+            event_buffer=event_buffer,
+            application=mock_application,
+            start_line_index=1,
+            start_item_index=1
+        )
+
+        producer.start()
+        time.sleep(0.2)
+
+        events = []
+        while True:
+            event = event_buffer.pop_event(timeout=0.1)
+            if event is None or event.event_type == MidiEventType.END_OF_SONG:
+                break
+            events.append(event)
+
+        producer.stop()
+
+        note_on_events = [e for e in events if e.event_type == MidiEventType.NOTE_ON]
+        assert [e.metadata['chord_info'].chord for e in note_on_events] == ["F"]
+        assert note_on_events[0].timestamp == 0.0
+        assert note_on_events[0].metadata['bar'] == 4
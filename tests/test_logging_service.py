@@ -0,0 +1,272 @@
+"""Tests for LoggingService and its formatter."""
+import logging
+import sys
+
+import pytest
+
+from services.logging_service import FastFormatter
+
+
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+@pytest.fixture
+def reference_formatter():
+    """The stdlib formatter FastFormatter replaces."""
+    return logging.Formatter(
+        fmt='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+        datefmt=DATE_FORMAT
+    )
+
+
+def make_record(msg='value is %s', args=(42,), exc_info=None, sinfo=None):
+    """Create a log record for formatting."""
+    return logging.LogRecord('app.module', logging.WARNING, __file__, 1, msg, args, exc_info, sinfo=sinfo)
+
+
+class TestFastFormatter:
+    """Test FastFormatter output matches the stdlib format string."""
+
+    def test_plain_message(self, reference_formatter):
+        """Test a message with arguments."""
+        record = make_record()
+        assert FastFormatter(DATE_FORMAT).format(record) == reference_formatter.format(record)
+
+    def test_message_without_arguments(self, reference_formatter):
+        """Test literal and non-string messages without arguments."""
+        for msg in ('100% done', 42):
+            record = make_record(msg=msg, args=())
+            assert FastFormatter(DATE_FORMAT).format(record) == reference_formatter.format(record)
+
+    def test_exception_info(self, reference_formatter):
+        """Test the traceback is appended after the message."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = make_record(exc_info=sys.exc_info())
+
+        assert FastFormatter(DATE_FORMAT).format(record) == reference_formatter.format(record)
+
+    def test_stack_info(self, reference_formatter):
+        """Test stack information is appended after the message."""
+        record = make_record(sinfo='Stack (most recent call last):\n  File "x.py", line 1')
+        assert FastFormatter(DATE_FORMAT).format(record) == reference_formatter.format(record)
+
+    def test_timestamp_reused_within_second(self):
+        """Test records in the same second share the formatted timestamp."""
+        formatter = FastFormatter(DATE_FORMAT)
+        first = make_record()
+        second = make_record()
+        second.created = int(first.created) + 0.999
+
+        assert formatter.formatTime(first, DATE_FORMAT) is formatter.formatTime(second, DATE_FORMAT)
+
+    def test_default_format_keeps_milliseconds(self):
+        """Test records in the same second keep their own milliseconds without a datefmt."""
+        formatter = FastFormatter()
+        first = make_record()
+        second = make_record()
+        first.created, first.msecs = 1000.123, 123.0
+        second.created, second.msecs = 1000.987, 987.0
+
+        assert formatter.formatTime(first).endswith(',123')
+        assert formatter.formatTime(second).endswith(',987')
+        assert formatter.format(second) == logging.Formatter(
+            '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
+        ).format(second)
+
+    def test_timestamp_changes_next_second(self):
+        """Test a record in a later second gets a new timestamp."""
+        formatter = FastFormatter(DATE_FORMAT)
+        first = make_record()
+        later = make_record()
+        later.created = first.created + 1
+
+        assert formatter.formatTime(later, DATE_FORMAT) == logging.Formatter(datefmt=DATE_FORMAT).formatTime(later, DATE_FORMAT)
+        assert formatter.formatTime(first, DATE_FORMAT) != formatter.formatTime(later, DATE_FORMAT)
+
+
+class TestLogLevels:
+    """Test log level name handling."""
+
+    def test_level_names_case_insensitive(self):
+        """Test level names are accepted in any case."""
+        from services.logging_service import _parse_level
+        assert _parse_level("debug") == logging.DEBUG
+        assert _parse_level("Warning") == logging.WARNING
+
+    def test_invalid_level_rejected(self):
+        """Test unknown and unsupported level names raise ValueError."""
+        from services.logging_service import LoggingService
+
+        with pytest.raises(ValueError):
+            LoggingService().set_log_level("verbose")
+        with pytest.raises(ValueError):
+            LoggingService().set_log_level("notset")
+
+
+class TestCountingRotatingFileHandler:
+    """Test size tracking and rollover of CountingRotatingFileHandler."""
+
+    def test_rolls_over_at_size_limit(self, tmp_path):
+        """Test files rotate before exceeding maxBytes."""
+        from services.logging_service import CountingRotatingFileHandler
+
+        log_file = tmp_path / "app.log"
+        handler = CountingRotatingFileHandler(log_file, maxBytes=100, backupCount=2, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        for i in range(20):
+            handler.handle(make_record(msg='record %02d', args=(i,)))
+        handler.close()
+
+        assert (tmp_path / "app.log.1").exists()
+        assert (tmp_path / "app.log.2").exists()
+        assert not (tmp_path / "app.log.3").exists()
+        assert log_file.stat().st_size <= 100
+        assert log_file.read_text(encoding='utf-8').splitlines()[-1] == "record 19"
+
+    def test_counts_encoded_bytes(self, tmp_path):
+        """Test multi-byte characters count towards maxBytes by encoded size."""
+        from services.logging_service import CountingRotatingFileHandler
+
+        log_file = tmp_path / "app.log"
+        handler = CountingRotatingFileHandler(log_file, maxBytes=100, backupCount=2, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        for i in range(20):
+            handler.handle(make_record(msg='C♯°Δ B♭ %02d', args=(i,)))
+        handler.close()
+
+        assert (tmp_path / "app.log.1").exists()
+        for path in (log_file, tmp_path / "app.log.1", tmp_path / "app.log.2"):
+            assert path.stat().st_size <= 100
+        assert log_file.read_text(encoding='utf-8').splitlines()[-1] == "C♯°Δ B♭ 19"
+
+    def test_counts_existing_file_size(self, tmp_path):
+        """Test appending to an existing log starts from its current size."""
+        from services.logging_service import CountingRotatingFileHandler
+
+        log_file = tmp_path / "app.log"
+        log_file.write_text("x" * 90 + "\n", encoding='utf-8')
+        handler = CountingRotatingFileHandler(log_file, maxBytes=100, backupCount=1, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        handler.handle(make_record(msg='this record does not fit', args=()))
+        handler.close()
+
+        assert (tmp_path / "app.log.1").read_text(encoding='utf-8') == "x" * 90 + "\n"
+        assert log_file.read_text(encoding='utf-8') == "this record does not fit\n"
+
+
+class TestLoggingServiceConfiguration:
+    """Test LoggingService configuration and shutdown."""
+
+    class FakeAppData:
+        """Minimal AppDataService stand-in pointing at a temp directory."""
+
+        def __init__(self, directory):
+            self._directory = directory
+
+        def get_log_file_path(self):
+            return self._directory / "app.log"
+
+    @pytest.fixture(autouse=True)
+    def restore_root_logger(self):
+        """Restore the root logger's handlers and level after each test."""
+        root = logging.getLogger()
+        handlers, level = root.handlers[:], root.level
+        yield
+        root.handlers[:] = handlers
+        root.setLevel(level)
+
+    def test_records_written_to_file_on_shutdown(self, tmp_path):
+        """Test queued and buffered records reach the log file on shutdown."""
+        from services.logging_service import LoggingService
+
+        service = LoggingService()
+        service.configure_logging(self.FakeAppData(tmp_path), "INFO", console_output=False)
+        logging.getLogger("test.module").info("hello %s", "world")
+        service.shutdown()
+
+        assert "[INFO] test.module: hello world" in (tmp_path / "app.log").read_text(encoding='utf-8')
+
+    def test_reconfiguration_takes_over_handlers(self, tmp_path):
+        """Test a second configuration for the same file stops the first one's threads."""
+        import threading
+        from services.logging_service import LoggingService
+
+        def flushers():
+            return [t for t in threading.enumerate() if t.name == "LogFlusher"]
+
+        first = LoggingService()
+        first.configure_logging(self.FakeAppData(tmp_path), "INFO", console_output=False)
+        second = LoggingService()
+        second.configure_logging(self.FakeAppData(tmp_path), "DEBUG", console_output=False)
+        logging.getLogger("test.module").debug("after reconfiguration")
+
+        assert len(flushers()) == 1
+        second.shutdown()
+        first.shutdown()
+        assert flushers() == []
+
+        content = (tmp_path / "app.log").read_text(encoding='utf-8')
+        assert content.count("[DEBUG] test.module: after reconfiguration") == 1
+        assert content.count("logging initialized") == 2
+
+    def test_released_instance_shutdown_keeps_handlers(self, tmp_path):
+        """Test shutting down a taken-over instance doesn't close the new owner's handlers."""
+        from services.logging_service import LoggingService
+
+        first = LoggingService()
+        first.configure_logging(self.FakeAppData(tmp_path), "INFO", console_output=False)
+        second = LoggingService()
+        second.configure_logging(self.FakeAppData(tmp_path), "DEBUG", console_output=False)
+        first.shutdown()
+        logging.getLogger("test.module").error("after first shutdown")
+        second.shutdown()
+
+        content = (tmp_path / "app.log").read_text(encoding='utf-8')
+        assert "[ERROR] test.module: after first shutdown" in content
+        assert content.count("logging initialized") == 2
+
+    def test_console_skipped_when_stdout_not_a_tty(self, tmp_path, monkeypatch):
+        """Test console output is dropped for redirected stdout unless forced."""
+        import io
+        from services.logging_service import LoggingService
+
+        monkeypatch.setattr(sys, "stdout", io.StringIO())
+        service = LoggingService()
+        service.configure_logging(self.FakeAppData(tmp_path), "INFO", console_output=True)
+        assert service._console_handler is None
+        service.shutdown()
+
+        forced = LoggingService()
+        forced.configure_logging(self.FakeAppData(tmp_path), "INFO", console_output=True, force_console=True)
+        assert forced._console_handler is not None
+        forced.shutdown()
+
+
+class TestByteStreamHandler:
+    """Test ByteStreamHandler output."""
+
+    def test_writes_encoded_lines(self):
+        """Test records are written as encoded, newline-terminated bytes."""
+        import io
+        from services.logging_service import ByteStreamHandler
+
+        stream = io.BytesIO()
+        handler = ByteStreamHandler(stream, 'utf-8')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        handler.handle(make_record(msg='note %s', args=('C♯',)))
+
+        assert stream.getvalue() == 'note C♯\n'.encode('utf-8')
+
+    def test_unencodable_characters_escaped(self):
+        """Test characters the encoding can't represent don't drop the record."""
+        import io
+        from services.logging_service import ByteStreamHandler
+
+        stream = io.BytesIO()
+        handler = ByteStreamHandler(stream, 'ascii')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        handler.handle(make_record(msg='note %s', args=('C♯',)))
+
+        assert stream.getvalue() == b'note C\\u266f\n'
@@ -185,6 +185,40 @@ class TestInitialization:
             assert result is False
             assert service.is_initialized is False
 
+    def test_initialize_player_preloads_programs(self):
+        """Test that configured programs are loaded once at initialization."""
+        config = Mock(spec=ConfigService)
+        config.get.side_effect = lambda key, default=None: {
+            "instrument": 0,
+            "preload_programs": [0, 24, 24, 40],
+        }.get(key, default)
+        service = PlaybackService(config)
+
+        with patch('services.playback_service.NotePlayer') as mock_note_player_class:
+            mock_player = Mock()
+            mock_player.load_program.return_value = True
+            mock_note_player_class.return_value = mock_player
+
+            assert service.initialize_player() is True
+
+            loaded = {c.args[0] for c in mock_player.load_program.call_args_list}
+            assert loaded == {0, 24, 40}
+
+    def test_initialize_player_async_waits_on_first_use(self, mock_config):
+        """Test that background initialization completes before playback uses the player."""
+        service = PlaybackService(mock_config)  # No player injected
+
+        with patch('services.playback_service.NotePlayer') as mock_note_player_class:
+            mock_player = Mock()
+            mock_note_player_class.return_value = mock_player
+
+            service.initialize_player_async()
+            service.play_notes_immediate([60, 64, 67])
+
+            assert service.is_initialized is True
+            mock_note_player_class.assert_called_once()
+            mock_player.play_notes_immediate.assert_called_once_with([60, 64, 67])
+
 
 class TestChordPlayback:
     """Tests for immediate chord playback."""
@@ -222,6 +256,22 @@ class TestChordPlayback:
         assert len(midi_notes) >= 3
         assert all(isinstance(note, int) for note in midi_notes)
 
+    def test_play_chord_immediate_resolves_each_chord_once(self, initialized_service):
+        """Test repeated clicks on a chord reuse its resolution, per key for roman numerals."""
+        service, mock_player = initialized_service
+        absolute = ChordInfo(chord="Am", start=0, end=2, is_valid=True, is_relative=False)
+        relative = ChordInfo(chord="V", start=0, end=1, is_valid=True, is_relative=True)
+
+        service.play_chord_immediate(absolute, current_key="C")
+        service._chord_helper = Mock(wraps=service._chord_helper)
+        service.play_chord_immediate(absolute, current_key="G")
+        service.play_chord_immediate(relative, current_key="C")
+        service.play_chord_immediate(relative, current_key="C")
+        service.play_chord_immediate(relative, current_key="D")
+
+        assert service._chord_helper.compute_chord_notes.call_count == 2
+        assert mock_player.play_notes_immediate.call_count == 5
+
     def test_play_chord_immediate_invalid_chord(self, initialized_service):
         """Test that invalid chords don't crash."""
         service, mock_player = initialized_service
@@ -824,6 +874,41 @@ class TestPlaybackControls:
 
         mock_player.set_bpm.assert_called_once_with(140)
 
+    def test_setters_skip_unchanged_values(self, initialized_service):
+        """Test setting the current BPM or instrument again doesn't reach the player."""
+        service, mock_player = initialized_service
+
+        service.set_bpm(120)
+        service.set_instrument(24)
+        service.set_instrument(24)
+
+        mock_player.set_bpm.assert_not_called()
+        mock_player.set_instrument.assert_called_once_with(24)
+
+    def test_set_instrument_keeps_program_resident(self, initialized_service):
+        """Test a selected program is pinned so switching back doesn't reload it."""
+        service, mock_player = initialized_service
+
+        service.set_instrument(24)
+
+        mock_player.load_program.assert_called_once_with(24)
+        mock_player.set_instrument.assert_called_once_with(24)
+
+    def test_set_voicing_reuses_pickers(self, initialized_service):
+        """Test switching back to a voicing reuses its note picker."""
+        service, _ = initialized_service
+
+        service.set_voicing("guitar:standard")
+        guitar_picker = service._note_picker
+        service.set_voicing("piano")
+        piano_picker = service._note_picker
+        service.set_voicing("guitar:standard")
+
+        assert service._note_picker is guitar_picker
+        assert piano_picker is not guitar_picker
+        service.set_voicing("guitar:drop_d")
+        assert service._note_picker is not guitar_picker
+
 
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
@@ -0,0 +1,57 @@
+"""Tests for PlaybackState loop tracking."""
+import dataclasses
+
+import pytest
+
+from models.playback_state import LoopContext, PlaybackState
+
+
+class TestPlaybackStateLoops:
+    """Test the loop stack of PlaybackState."""
+
+    def test_no_loop(self):
+        """Test loop queries outside a loop."""
+        state = PlaybackState()
+
+        assert state.is_in_loop() is False
+        assert state.current_loop() is None
+        assert state.loop_should_continue() is False
+        assert state.pop_loop() is None
+        state.increment_loop()  # No-op outside a loop
+
+    def test_increment_until_done(self):
+        """Test a loop continues until its last iteration."""
+        state = PlaybackState()
+        state.push_loop("chorus", 5, 3)
+
+        assert state.loop_should_continue() is True
+        state.increment_loop()
+        assert state.current_loop().current_iteration == 2
+        assert state.loop_should_continue() is True
+        state.increment_loop()
+        assert state.current_loop().current_iteration == 3
+        assert state.loop_should_continue() is False
+
+    def test_increment_affects_innermost_loop(self):
+        """Test nested loops advance independently."""
+        state = PlaybackState()
+        state.push_loop("verse", 1, 2)
+        state.push_loop("chorus", 5, 2)
+
+        state.increment_loop()
+        inner = state.pop_loop()
+        assert (inner.label, inner.current_iteration) == ("chorus", 2)
+
+        outer = state.current_loop()
+        assert (outer.label, outer.start_line, outer.current_iteration) == ("verse", 1, 1)
+        assert state.loop_should_continue() is True
+
+    def test_loop_context_is_read_only(self):
+        """Test snapshots can't be mistaken for the live loop."""
+        state = PlaybackState()
+        state.push_loop("chorus", 5, 2)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            state.current_loop().current_iteration = 2
+        assert state.current_loop() == LoopContext("chorus", 5, 1, 2)
+        assert state.current_loop().should_continue() is True
@@ -44,6 +44,32 @@ Dm G C C"""
         assert song.lines[2].type == LineType.CHORD
         assert len(song.lines[2].chords) == 4
 
+    def test_song_line_arrays(self, song_parser):
+        """Test the per-line type codes and content offsets."""
+        text = """{bpm: 100}
+C F G Am
+Verse lyrics here
+Dm G C C"""
+        song = song_parser.build_song(text, notation="american")
+
+        assert list(song.line_types) == [2, 1, 0, 1]
+        assert list(song.line_content_offsets) == [0, 11, 20, 38]
+        assert song.chord_line_indices() == [1, 3]
+
+    def test_next_label_after(self, song_parser):
+        """Test finding the nearest label following a line."""
+        text = """{label: verse}
+C F G Am
+{label: chorus}
+Dm G C C
+{label: bridge}"""
+        song = song_parser.build_song(text, notation="american")
+
+        assert song.next_label_after(0).name == "verse"
+        assert song.next_label_after(1).name == "chorus"
+        assert song.next_label_after(4).name == "bridge"
+        assert song.next_label_after(5) is None
+
     def test_build_song_with_directives(self, song_parser):
         """Test building a song with directives."""
         text = """{bpm: 120}
@@ -488,6 +488,16 @@ class TestChordValidation:
         assert not song_parser.validate_chord("X", notation="american")
         assert not song_parser.validate_chord("H", notation="american")
 
+    def test_cached_lookups_return_fresh_lists(self, song_parser):
+        """Test that memoized chord lookups can't be corrupted by callers."""
+        notes = song_parser.get_chord_notes("Am")
+        notes.append("X")
+        assert song_parser.get_chord_notes("Am") == ['A', 'C', 'E']
+
+        midi = song_parser.chord_to_midi("C", base_octave=4)
+        midi.clear()
+        assert song_parser.chord_to_midi("C", base_octave=4) == [60, 64, 67]
+
 
 class TestNotationConversion:
     """Tests for notation conversion."""
@@ -570,3 +580,16 @@ Am Dm G // chorus"""
         assert len(lines[0].chords) == 3
         # The commented directive should not be parsed
         assert len(lines[0].directives) == 0
+
+    def test_directive_positions_after_comment(self, song_parser):
+        """Test that comments don't shift the positions of later directives."""
+        text = "C G // intro\n{label: verse} G\n{loop: verse 2}"
+        lines = song_parser.detect_chords_in_text(text, notation=Notation.AMERICAN)
+
+        assert lines[0].directives == []
+        assert [d.start for d in lines[1].directives] == [text.index("{label")]
+        assert [d.start for d in lines[2].directives] == [text.index("{loop")]
+
+        song = song_parser.build_song(text, notation=Notation.AMERICAN)
+        assert song.labels["verse"].line_number == 2
+        assert song.labels["verse"].offset == 0